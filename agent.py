@@ -12,7 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config.config import Config
-from modules.a2a_server import A2AServer
+from modules.a2a_server import A2AServer, AgentCard
 from modules.message_handler import MessageHandler
 from utils.logger import setup_logger
 
@@ -32,29 +32,15 @@ def main():
         Config.validate()
         logger.info("Configuration validated successfully")
         
-        # Initialize message handler
-        message_handler = MessageHandler()
-        logger.info("Message handler initialized")
-        
-        # Initialize A2A server
-        server = A2AServer(message_handler.handle_message)
-        logger.info("A2A server initialized")
-        
-        # Check if agent_card.json exists
-        agent_card_path = Path('agent_card.json')
-        if not agent_card_path.exists():
+        # Load and validate agent_card.json once, before anything heavy starts
+        if not AgentCard.load_and_validate():
             logger.error("agent_card.json not found in project root!")
             print("\n❌ ERROR: agent_card.json not found!")
             print("Please ensure agent_card.json is in the project root directory.\n")
             sys.exit(1)
         
-        # Validate agent_card.json has been configured
-        import json
-        with open(agent_card_path, 'r') as f:
-            agent_card = json.load(f)
-        
         # Check for placeholder values
-        if "REPLACE_" in agent_card.get('url', ''):
+        if not AgentCard.is_configured:
             logger.error("agent_card.json not configured!")
             print("\n❌ ERROR: agent_card.json has not been configured!")
             print("\nPlease update agent_card.json with your actual values:")
@@ -64,7 +50,15 @@ def main():
             print("\nSee agent_card.json for detailed instructions.\n")
             sys.exit(1)
         
-        logger.info(f"Agent card found and validated at: {agent_card_path.absolute()}")
+        logger.info("Agent card found and validated at: %s", AgentCard.PATH.absolute())
+        
+        # Initialize message handler
+        message_handler = MessageHandler()
+        logger.info("Message handler initialized")
+        
+        # Initialize A2A server
+        server = A2AServer(message_handler.handle_message)
+        logger.info("A2A server initialized")
         
         # Start the server
         print("\n🚀 Starting Smart Read Later Organizer...")
@@ -81,7 +75,9 @@ def main():
         server.run(
             host=Config.WEBHOOK_HOST,
             port=port,
-            debug=False
+            debug=False,
+            server_type=Config.SERVER_TYPE,
+            threads=Config.SERVER_THREADS
         )
     
     except KeyboardInterrupt:
@@ -90,7 +86,7 @@ def main():
         sys.exit(0)
     
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         print(f"\n❌ Fatal error: {e}")
         print("Check logs/agent.log for details\n")
         sys.exit(1)
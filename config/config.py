@@ -19,13 +19,20 @@ class Config:
     # Server Configuration
     WEBHOOK_HOST: str = os.getenv("WEBHOOK_HOST", "0.0.0.0")
     WEBHOOK_PORT: int = int(os.getenv("WEBHOOK_PORT", "5000"))
+    SERVER_TYPE: str = os.getenv("SERVER_TYPE", "waitress")  # waitress or flask
+    SERVER_THREADS: int = int(os.getenv("SERVER_THREADS", "8"))
+    MAX_WEBHOOK_BYTES: int = 1_000_000  # largest webhook body accepted
+    WEBHOOK_WORKERS: int = int(os.getenv("WEBHOOK_WORKERS", "1"))  # >1 runs callbacks concurrently
     
     # Storage Configuration
     DATABASE_PATH: str = os.getenv("DATABASE_PATH", "data/read_later.db")
     
     # Content Processing Configuration
     MAX_CONTENT_LENGTH: int = 50000  # characters
+    MAX_HTML_BYTES: int = 2_000_000  # largest HTML page downloaded
     DEFAULT_CATEGORY: str = "Uncategorized"
+    SPACY_BATCH_SIZE: int = int(os.getenv("SPACY_BATCH_SIZE", "64"))  # bulk re-analysis
+    SPACY_N_PROCESS: int = int(os.getenv("SPACY_N_PROCESS", "1"))  # >1 forks workers
     MIN_READING_TIME: int = 1  # minutes
     
     # Scheduling Configuration
@@ -57,7 +64,7 @@ class Config:
         """Display current configuration (excluding sensitive data)."""
         print(f"=== {cls.AGENT_NAME} v{cls.AGENT_VERSION} ===")
         print(f"Base URL: {cls.AGENT_BASE_URL}")
-        print(f"Server: {cls.WEBHOOK_HOST}:{cls.WEBHOOK_PORT}")
+        print(f"Server: {cls.WEBHOOK_HOST}:{cls.WEBHOOK_PORT} ({cls.SERVER_TYPE})")
         print(f"Database: {cls.DATABASE_PATH}")
         print(f"Log Level: {cls.LOG_LEVEL}")
         print("=" * 50)
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Smart Read Later Organizer - WSGI entry point for Gunicorn.
+
+Usage:
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:$PORT gunicorn_entry:app
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config.config import Config
+from modules.a2a_server import A2AServer
+from modules.message_handler import MessageHandler
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+Config.validate()
+
+# Each Gunicorn worker process builds its own handler and server
+message_handler = MessageHandler()
+app = A2AServer(message_handler.handle_message).app
+
+logger.info("WSGI application ready")
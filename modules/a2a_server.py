@@ -1,14 +1,97 @@
 """
 A2A Protocol Server - Handles JSON-RPC requests from Telex.
 """
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request
 from typing import Dict, Any, Optional, Callable
+from email.utils import formatdate
+from uuid import uuid4
+import hashlib
 import json
+import orjson
+import fastjsonschema
 from pathlib import Path
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+class AgentCard:
+    """
+    Startup-once cache of agent_card.json.
+    
+    The card never changes while the process is running, so it is read,
+    parsed and checked for placeholder values a single time; the raw bytes
+    are then served directly on every agent-card request.
+    """
+    
+    PATH = Path('agent_card.json')
+    PLACEHOLDER = b'REPLACE_'
+    
+    raw: Optional[bytes] = None
+    data: Optional[Dict[str, Any]] = None
+    mtime: Optional[float] = None
+    etag: Optional[str] = None
+    is_configured: bool = False
+    
+    @classmethod
+    def load_and_validate(cls) -> bool:
+        """
+        Load agent_card.json (once) and check it has been configured.
+        
+        Returns:
+            True if the card was loaded, False if it is missing or invalid JSON
+        """
+        if cls.raw is not None:
+            return True
+        
+        try:
+            raw = cls.PATH.read_bytes()
+            data = json.loads(raw)
+            mtime = cls.PATH.stat().st_mtime
+        except (OSError, ValueError) as e:
+            logger.error("Could not load agent card: %s", e)
+            return False
+        
+        cls.raw, cls.data, cls.mtime = raw, data, mtime
+        cls.etag = hashlib.md5(raw).hexdigest()
+        # A single bytes search covers every placeholder in the file
+        cls.is_configured = cls.PLACEHOLDER not in raw
+        return True
+
+
+# JSON-RPC 2.0 request envelope, compiled once into a validator function
+_ENVELOPE_SCHEMA = {
+    "type": "object",
+    "required": ["jsonrpc", "method"],
+    "properties": {
+        "jsonrpc": {"const": "2.0"},
+        "method": {"type": "string", "minLength": 1},
+        "id": {},
+        "params": {"type": "object"}
+    }
+}
+_validate_envelope = fastjsonschema.compile(_ENVELOPE_SCHEMA)
+
+# Health check body, serialized once; probes hit it far more than anything else
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Smart Read Later Organizer",
+    "protocol": "A2A"
+})
+
+
+def _json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Serialize a payload with orjson into a Flask response.
+    
+    Args:
+        payload: JSON-serializable data
+        status: HTTP status code
+        
+    Returns:
+        Flask Response with application/json mimetype
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
 
 class A2AServer:
     """Flask server implementing A2A protocol for Telex integration."""
@@ -22,6 +105,7 @@ class A2AServer:
         """
         self.app = Flask(__name__)
         self.message_handler = message_handler
+        AgentCard.load_and_validate()
         self._setup_routes()
         logger.info("A2A Server initialized")
     
@@ -36,87 +120,110 @@ class A2AServer:
             Returns Agent Card JSON with skills and configuration.
             """
             try:
-                agent_card_path = Path('agent_card.json')
-                
-                if not agent_card_path.exists():
+                if AgentCard.raw is None:
                     logger.error("agent_card.json not found")
-                    return jsonify({
+                    return _json_response({
                         "error": "Agent card not found"
-                    }), 404
+                    }, 404)
                 
                 logger.info("Agent card requested")
-                return send_file(
-                    agent_card_path,
-                    mimetype='application/json'
-                )
+                response = Response(AgentCard.raw, mimetype='application/json')
+                response.set_etag(AgentCard.etag)
+                response.headers['Last-Modified'] = formatdate(AgentCard.mtime, usegmt=True)
+                response.headers['Cache-Control'] = 'public, max-age=300'
+                # Answers If-None-Match / If-Modified-Since with 304 Not Modified
+                return response.make_conditional(request)
             
             except Exception as e:
-                logger.error(f"Error serving agent card: {e}")
-                return jsonify({"error": str(e)}), 500
+                logger.error("Error serving agent card: %s", e)
+                return _json_response({"error": str(e)}, 500)
         
         @self.app.route('/', methods=['POST'])
         def handle_jsonrpc():
             """
             Handle JSON-RPC requests from Telex.
             
-            Routes requests to appropriate handlers based on method.
+            Accepts a single request object or a JSON-RPC 2.0 batch (array of
+            request objects), so many calls can share one HTTP round-trip.
             """
             try:
-                body = request.get_json()
-                
+                body = orjson.loads(request.get_data())
+            except orjson.JSONDecodeError:
+                body = None
+            
+            if isinstance(body, list):
                 if not body:
-                    return self._error_response(None, -32700, "Parse error")
-                
-                # Validate JSON-RPC structure
-                if body.get('jsonrpc') != '2.0':
-                    return self._error_response(
-                        body.get('id'),
-                        -32600,
-                        "Invalid Request: jsonrpc must be '2.0'"
+                    return _json_response(
+                        self._error_response(None, -32600, "Invalid Request: empty batch")
                     )
                 
-                method = body.get('method')
-                request_id = body.get('id')
-                params = body.get('params', {})
-                
-                if not method:
-                    return self._error_response(request_id, -32600, "Invalid Request: method required")
-                
-                logger.info(f"Received JSON-RPC request: method={method}, id={request_id}")
-                logger.debug(f"Request params: {params}")
-                
-                # Route to appropriate handler
-                if method == "message/send":
-                    result = self._handle_message_send(params)
-                    return self._success_response(request_id, result)
-                
-                elif method == "task/subscribe":
-                    result = self._handle_task_subscribe(params)
-                    return self._success_response(request_id, result)
+                responses = []
+                for item in body:
+                    response = self._dispatch_single(item)
+                    # Notifications (no "id") get no entry in the batch response
+                    if isinstance(item, dict) and 'id' not in item:
+                        continue
+                    responses.append(response)
                 
-                else:
-                    return self._error_response(
-                        request_id,
-                        -32601,
-                        f"Method not found: {method}"
-                    )
+                if not responses:
+                    return Response(status=204)
+                return _json_response(responses)
             
-            except Exception as e:
-                logger.error(f"Error handling JSON-RPC request: {e}", exc_info=True)
-                return self._error_response(
-                    body.get('id') if body else None,
-                    -32603,
-                    f"Internal error: {str(e)}"
-                )
+            if not body:
+                return _json_response(self._error_response(None, -32700, "Parse error"))
+            
+            return _json_response(self._dispatch_single(body))
         
         @self.app.route('/health', methods=['GET'])
         def health_check():
             """Health check endpoint."""
-            return jsonify({
-                "status": "healthy",
-                "service": "Smart Read Later Organizer",
-                "protocol": "A2A"
-            }), 200
+            return Response(_HEALTH_BODY, mimetype='application/json',
+                            headers={'Cache-Control': 'no-cache'})
+    
+    def _dispatch_single(self, body: Any) -> Dict[str, Any]:
+        """
+        Validate and route one JSON-RPC request object.
+        
+        Args:
+            body: Decoded request object (one element of a batch, or the whole body)
+            
+        Returns:
+            JSON-RPC response dictionary
+        """
+        request_id = body.get('id') if isinstance(body, dict) else None
+        
+        try:
+            # Validate JSON-RPC structure
+            try:
+                _validate_envelope(body)
+            except fastjsonschema.JsonSchemaException as e:
+                return self._error_response(request_id, -32600, f"Invalid Request: {e.message}")
+            
+            method = body['method']
+            params = body.get('params', {})
+            
+            logger.info("Received JSON-RPC request: method=%s, id=%s", method, request_id)
+            logger.debug("Request params: %s", params)
+            
+            # Route to appropriate handler
+            if method == "message/send":
+                result = self._handle_message_send(params)
+                return self._success_response(request_id, result)
+            
+            elif method == "task/subscribe":
+                result = self._handle_task_subscribe(params)
+                return self._success_response(request_id, result)
+            
+            else:
+                return self._error_response(
+                    request_id,
+                    -32601,
+                    f"Method not found: {method}"
+                )
+        
+        except Exception as e:
+            logger.error("Error handling JSON-RPC request: %s", e, exc_info=True)
+            return self._error_response(request_id, -32603, f"Internal error: {str(e)}")
     
     def _handle_message_send(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -136,15 +243,15 @@ class A2AServer:
         role = message.get('role')
         parts = message.get('parts', [])
         
-        logger.info(f"Processing message from {role} with {len(parts)} parts")
+        logger.info("Processing message from %s with %s parts", role, len(parts))
         
         # Extract text from parts
-        user_text = ""
-        for part in parts:
-            if part.get('type') == 'text' or part.get('kind') == 'text':
-                user_text += part.get('text', '')
+        user_text = ''.join(
+            part.get('text', '') for part in parts
+            if part.get('type') == 'text' or part.get('kind') == 'text'
+        )
         
-        logger.debug(f"User message: {user_text}")
+        logger.debug("User message: %s", user_text)
         
         # Call the message handler to process the message
         response_text = self.message_handler({
@@ -186,7 +293,7 @@ class A2AServer:
             "message": "Task subscription not yet implemented"
         }
     
-    def _success_response(self, request_id: Any, result: Dict[str, Any]) -> tuple:
+    def _success_response(self, request_id: Any, result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Build JSON-RPC success response.
         
@@ -195,16 +302,15 @@ class A2AServer:
             result: Result data to return
             
         Returns:
-            Tuple of (response_dict, status_code)
+            JSON-RPC response dictionary
         """
-        response = {
+        return {
             "jsonrpc": "2.0",
             "id": request_id,
             "result": result
         }
-        return jsonify(response), 200
     
-    def _error_response(self, request_id: Any, code: int, message: str) -> tuple:
+    def _error_response(self, request_id: Any, code: int, message: str) -> Dict[str, Any]:
         """
         Build JSON-RPC error response.
         
@@ -214,7 +320,7 @@ class A2AServer:
             message: Error message
             
         Returns:
-            Tuple of (response_dict, status_code)
+            JSON-RPC response dictionary (sent with HTTP 200)
         """
         response = {
             "jsonrpc": "2.0",
@@ -224,15 +330,15 @@ class A2AServer:
                 "message": message
             }
         }
-        logger.warning(f"Returning error response: {code} - {message}")
-        return jsonify(response), 200  # JSON-RPC errors still return 200
+        logger.warning("Returning error response: %s - %s", code, message)
+        return response
     
     def _generate_message_id(self) -> str:
-        """Generate a unique message ID."""
-        import uuid
-        return str(uuid.uuid4())
+        """Generate a unique message ID (UUID4 in 32-char hex form)."""
+        return uuid4().hex
     
-    def run(self, host: str = '0.0.0.0', port: int = 5000, debug: bool = False):
+    def run(self, host: str = '0.0.0.0', port: int = 5000, debug: bool = False,
+            server_type: str = 'flask', threads: int = 8):
         """
         Start the A2A server.
         
@@ -240,14 +346,28 @@ class A2AServer:
             host: Host to bind to
             port: Port to listen on
             debug: Enable Flask debug mode
+            server_type: 'waitress' for the multi-threaded production server,
+                'flask' for the development server
+            threads: Worker threads when running under Waitress
         """
-        logger.info(f"Starting A2A server on {host}:{port}")
-        logger.info(f"Agent Card: http://{host}:{port}/.well-known/agent.json")
-        logger.info(f"JSON-RPC endpoint: http://{host}:{port}/")
+        logger.info("Starting A2A server on %s:%s", host, port)
+        logger.info("Agent Card: http://%s:%s/.well-known/agent.json", host, port)
+        logger.info("JSON-RPC endpoint: http://%s:%s/", host, port)
+        
+        if server_type == 'waitress' and not debug:
+            try:
+                from waitress import serve
+            except ImportError:
+                logger.warning("waitress not installed, falling back to Flask dev server")
+            else:
+                logger.info("Serving with Waitress (%s threads)", threads)
+                serve(self.app, host=host, port=port, threads=threads)
+                return
         
         self.app.run(
             host=host,
             port=port,
             debug=debug,
+            threaded=True,
             use_reloader=False
-        )
\ No newline at end of file
+        )
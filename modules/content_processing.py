@@ -2,15 +2,89 @@
 Content Processing Module - NLP-based categorization and analysis.
 Uses spaCy for intelligent content understanding.
 """
+import numpy as np
 import spacy
-from typing import Optional, List, Dict, Any, Set
+from spacy.attrs import IS_STOP, LENGTH, LOWER, POS
+from spacy.symbols import ADJ, NOUN, PROPN, VERB
+from typing import Optional, List, Dict, Any, Set, Iterable
 from collections import Counter
+from array import array
+from functools import lru_cache
 import re
+import threading
+from config.config import Config
 from utils.logger import setup_logger
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional accelerator
+    ahocorasick = None
+
 logger = setup_logger(__name__)
 
 
+# Lowercase words of three or more letters
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True if char counts as part of a word (same as regex \\w)."""
+    return char.isalnum() or char == '_'
+
+
+# Serializes the first load of each spaCy pipeline
+_NLP_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _get_nlp(model_name: str, exclude: tuple):
+    """
+    Load a spaCy pipeline once per process.
+    
+    Args:
+        model_name: spaCy model to load
+        exclude: Pipeline components to leave out
+        
+    Returns:
+        Loaded spaCy Language object
+    """
+    nlp = spacy.load(model_name, exclude=list(exclude))
+    
+    # Sentence boundaries come from the cheap senter instead of the parser
+    if 'senter' in nlp.disabled:
+        nlp.enable_pipe('senter')
+    elif 'senter' not in nlp.pipe_names:
+        nlp.add_pipe('sentencizer')
+    return nlp
+
+
+def _build_keyword_automaton(category_keywords: Dict[str, Set[str]]):
+    """
+    Build an Aho-Corasick automaton over all category keywords.
+    
+    Args:
+        category_keywords: Mapping of category name to its keywords
+        
+    Returns:
+        Automaton mapping each keyword to its length and the ids (positions
+        in category_keywords) of the categories it scores for, or None if
+        pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    category_ids_by_keyword = {}
+    for category_id, keywords in enumerate(category_keywords.values()):
+        for keyword in keywords:
+            category_ids_by_keyword.setdefault(keyword.lower(), []).append(category_id)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, category_ids in category_ids_by_keyword.items():
+        automaton.add_word(keyword, (len(keyword), tuple(category_ids)))
+    automaton.make_automaton()
+    return automaton
+
+
 class ContentProcessor:
     """
     Processes article content using NLP for categorization and analysis.
@@ -73,6 +147,52 @@ class ContentProcessor:
         }
     }
     
+    # spaCy components never used: lemmas are not read, and the dependency
+    # parser is only needed for sentence boundaries, which senter provides.
+    # attribute_ruler stays, since it maps tags to the token.pos_ values used
+    # for keywords and summaries.
+    EXCLUDED_PIPES = ['lemmatizer', 'parser']
+    
+    # Common stop words skipped by the simple keyword extractor
+    STOP_WORDS = frozenset({
+        'the', 'is', 'at', 'which', 'on', 'a', 'an', 'as', 'are', 'was', 'were',
+        'been', 'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+        'could', 'should', 'may', 'might', 'must', 'can', 'of', 'to', 'in', 'for',
+        'with', 'by', 'from', 'about', 'into', 'through', 'during', 'before',
+        'after', 'above', 'below', 'up', 'down', 'out', 'off', 'over', 'under',
+        'again', 'further', 'then', 'once', 'this', 'that', 'these', 'those'
+    })
+    
+    # Word lists for simple sentiment detection
+    POSITIVE_WORDS = frozenset({
+        'good', 'great', 'excellent', 'amazing', 'wonderful', 'best', 'love',
+        'like', 'enjoy', 'happy', 'positive', 'success', 'win', 'benefit',
+        'improve', 'better', 'perfect', 'fantastic', 'awesome', 'brilliant'
+    })
+    
+    NEGATIVE_WORDS = frozenset({
+        'bad', 'terrible', 'awful', 'worst', 'hate', 'dislike', 'poor',
+        'negative', 'fail', 'failure', 'problem', 'issue', 'wrong', 'worse',
+        'decline', 'loss', 'risk', 'threat', 'danger', 'crisis'
+    })
+    
+    # Category names indexed by category id
+    CATEGORY_NAMES = tuple(CATEGORY_KEYWORDS)
+    
+    # Keyword automaton shared by all instances, built once at import
+    KEYWORD_AUTOMATON = _build_keyword_automaton(CATEGORY_KEYWORDS)
+    
+    # One compiled whole-word alternation per category id, used when
+    # pyahocorasick is unavailable. The lookahead keeps matches zero-width so
+    # a keyword inside a phrase ('game' in 'video game') still counts, as it
+    # does with the automaton.
+    CATEGORY_PATTERNS = tuple(
+        re.compile(
+            r'\b(?=(?:' + '|'.join(map(re.escape, sorted(keywords, key=len, reverse=True))) + r')\b)'
+        )
+        for keywords in CATEGORY_KEYWORDS.values()
+    )
+    
     def __init__(self, model_name: str = "en_core_web_sm"):
         """
         Initialize content processor with spaCy model.
@@ -83,28 +203,41 @@ class ContentProcessor:
         self.model_name = model_name
         self.nlp = None
         self._load_model()
-        logger.info(f"ContentProcessor initialized with model: {model_name}")
+        logger.info("ContentProcessor initialized with model: %s", model_name)
     
     def _load_model(self):
         """Load spaCy model with error handling."""
         try:
-            self.nlp = spacy.load(self.model_name)
-            logger.info(f"spaCy model '{self.model_name}' loaded successfully")
+            self.nlp = self._load_pipeline()
+            logger.info("spaCy model '%s' loaded successfully", self.model_name)
         except OSError:
-            logger.warning(f"spaCy model '{self.model_name}' not found. Trying to download...")
+            logger.warning("spaCy model '%s' not found. Trying to download...", self.model_name)
             try:
                 import subprocess
                 subprocess.run(['python', '-m', 'spacy', 'download', self.model_name], 
                              check=True, capture_output=True)
-                self.nlp = spacy.load(self.model_name)
-                logger.info(f"spaCy model '{self.model_name}' downloaded and loaded")
+                self.nlp = self._load_pipeline()
+                logger.info("spaCy model '%s' downloaded and loaded", self.model_name)
             except Exception as e:
-                logger.error(f"Failed to load spaCy model: {e}")
+                logger.error("Failed to load spaCy model: %s", e)
                 logger.warning("ContentProcessor will work with limited functionality")
                 self.nlp = None
     
+    def _load_pipeline(self):
+        """
+        Load the spaCy pipeline without the components this class never reads.
+        
+        The pipeline is shared by every ContentProcessor using the same model.
+        
+        Returns:
+            Loaded spaCy Language object
+        """
+        with _NLP_LOCK:
+            return _get_nlp(self.model_name, tuple(self.EXCLUDED_PIPES))
+    
     def categorize_article(self, title: str, content: str, 
-                          description: Optional[str] = None) -> str:
+                          description: Optional[str] = None,
+                          normalized: bool = False) -> str:
         """
         Automatically categorize an article based on its content.
         
@@ -112,111 +245,134 @@ class ContentProcessor:
             title: Article title
             content: Article content
             description: Article description (optional)
+            normalized: True if the inputs are already lowercased
             
         Returns:
             Category name
         """
-        # Combine text sources (title has more weight)
-        text_to_analyze = f"{title} {title} {title}"  # Triple title for weight
+        # Score each category, indexed by category id. Title hits count
+        # three times and description hits twice.
+        category_scores = array('i', [0]) * len(self.CATEGORY_NAMES)
         
+        segments = [(title, 3), (content[:1000], 1)]  # First 1000 chars of content
         if description:
-            text_to_analyze += f" {description} {description}"  # Double description
-        
-        # Use first 1000 chars of content
-        text_to_analyze += f" {content[:1000]}"
+            segments.append((description, 2))
         
-        text_to_analyze = text_to_analyze.lower()
-        
-        # Score each category
-        category_scores = {}
-        
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            score = 0
-            for keyword in keywords:
-                # Count occurrences of keyword
-                count = text_to_analyze.count(keyword.lower())
-                score += count
-            
-            category_scores[category] = score
+        for text, weight in segments:
+            self._add_category_hits(text if normalized else text.lower(), weight, category_scores)
         
         # Get category with highest score
         if category_scores:
-            best_category = max(category_scores, key=category_scores.get)
-            best_score = category_scores[best_category]
+            best_score = max(category_scores)
+            best_id = category_scores.index(best_score)  # First id wins ties
+            best_category = self.CATEGORY_NAMES[best_id]
             
             # Only assign if score is above threshold
             if best_score >= 2:
-                logger.info(f"Categorized as '{best_category}' (score: {best_score})")
+                logger.info("Categorized as '%s' (score: %s)", best_category, best_score)
                 return best_category
         
         logger.info("No clear category match, using 'Uncategorized'")
         return "Uncategorized"
     
-    def extract_keywords(self, text: str, max_keywords: int = 10) -> List[str]:
+    def _add_category_hits(self, text: str, weight: int, category_scores: array) -> None:
+        """
+        Add weighted whole-word keyword hits in text to the category scores.
+        
+        Args:
+            text: Lowercased text to scan
+            weight: Score added per keyword hit
+            category_scores: Scores indexed by category id, updated in place
+        """
+        if self.KEYWORD_AUTOMATON is not None:
+            # Single pass over the text, counting whole-word keyword hits
+            last = len(text) - 1
+            for end, (length, category_ids) in self.KEYWORD_AUTOMATON.iter(text):
+                start = end - length + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end < last and _is_word_char(text[end + 1]):
+                    continue
+                for category_id in category_ids:
+                    category_scores[category_id] += weight
+        else:
+            for category_id, pattern in enumerate(self.CATEGORY_PATTERNS):
+                category_scores[category_id] += weight * len(pattern.findall(text))
+    
+    def extract_keywords(self, text: str, max_keywords: int = 10,
+                         tokens: Optional[List[str]] = None) -> List[str]:
         """
         Extract important keywords from text using NLP.
         
         Args:
             text: Text to analyze
             max_keywords: Maximum number of keywords to return
+            tokens: Pre-tokenized lowercase words of text for the fallback
+                    path (optional)
             
         Returns:
             List of keywords
         """
         if not self.nlp:
             # Fallback to simple extraction without NLP
-            return self._extract_keywords_simple(text, max_keywords)
+            return self._extract_keywords_simple(text, max_keywords, tokens)
         
         try:
             # Process text with spaCy
             doc = self.nlp(text[:5000])  # Limit to first 5000 chars
-            
-            # Extract nouns and proper nouns
-            keywords = []
-            for token in doc:
-                if token.pos_ in ['NOUN', 'PROPN'] and not token.is_stop:
-                    if len(token.text) > 2:  # Skip very short words
-                        keywords.append(token.text.lower())
-            
-            # Count frequency
-            keyword_counts = Counter(keywords)
-            
-            # Return most common
-            top_keywords = [word for word, count in keyword_counts.most_common(max_keywords)]
-            
-            logger.debug(f"Extracted {len(top_keywords)} keywords")
-            return top_keywords
+            return self._keywords_from_docs([doc], max_keywords)
         
         except Exception as e:
-            logger.error(f"Error extracting keywords: {e}")
-            return self._extract_keywords_simple(text, max_keywords)
+            logger.error("Error extracting keywords: %s", e)
+            return self._extract_keywords_simple(text, max_keywords, tokens)
     
-    def _extract_keywords_simple(self, text: str, max_keywords: int) -> List[str]:
+    def _keywords_from_docs(self, docs: List[Any], max_keywords: int) -> List[str]:
+        """
+        Pick the most frequent nouns and proper nouns from parsed spaCy docs.
+        
+        Args:
+            docs: Parsed spaCy Doc objects
+            max_keywords: Maximum number of keywords to return
+            
+        Returns:
+            List of keywords
+        """
+        # Extract nouns and proper nouns (as lowercase string hashes),
+        # skipping stop words and very short words
+        keyword_hashes = []
+        for doc in docs:
+            attrs = doc.to_array([POS, IS_STOP, LENGTH, LOWER])
+            mask = np.isin(attrs[:, 0], (NOUN, PROPN)) & (attrs[:, 1] == 0) & (attrs[:, 2] > 2)
+            keyword_hashes.extend(attrs[mask, 3].tolist())
+        
+        # Count frequency
+        keyword_counts = Counter(keyword_hashes)
+        
+        # Return most common, resolving only the winners back to strings
+        strings = docs[0].vocab.strings
+        top_keywords = [strings[h] for h, count in keyword_counts.most_common(max_keywords)]
+        
+        logger.debug("Extracted %s keywords", len(top_keywords))
+        return top_keywords
+    
+    def _extract_keywords_simple(self, text: str, max_keywords: int,
+                                 tokens: Optional[List[str]] = None) -> List[str]:
         """
         Simple keyword extraction without NLP (fallback method).
         
         Args:
             text: Text to analyze
             max_keywords: Maximum number of keywords
+            tokens: Pre-tokenized lowercase words of text (optional)
             
         Returns:
             List of keywords
         """
-        # Remove common stop words
-        stop_words = {
-            'the', 'is', 'at', 'which', 'on', 'a', 'an', 'as', 'are', 'was', 'were',
-            'been', 'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'could', 'should', 'may', 'might', 'must', 'can', 'of', 'to', 'in', 'for',
-            'with', 'by', 'from', 'about', 'into', 'through', 'during', 'before',
-            'after', 'above', 'below', 'up', 'down', 'out', 'off', 'over', 'under',
-            'again', 'further', 'then', 'once', 'this', 'that', 'these', 'those'
-        }
-        
         # Extract words
-        words = re.findall(r'\b[a-z]{3,}\b', text.lower())
+        words = tokens if tokens is not None else _WORD_RE.findall(text.lower())
         
         # Filter stop words
-        keywords = [w for w in words if w not in stop_words]
+        keywords = [w for w in words if w not in self.STOP_WORDS]
         
         # Count frequency
         keyword_counts = Counter(keywords)
@@ -239,31 +395,41 @@ class ContentProcessor:
             return {}
         
         try:
-            doc = self.nlp(text[:5000])
-            
-            entities = {
-                'PERSON': [],
-                'ORG': [],
-                'GPE': [],  # Geopolitical entities (countries, cities)
-                'DATE': [],
-                'MONEY': [],
-                'PRODUCT': []
-            }
-            
-            for ent in doc.ents:
-                if ent.label_ in entities:
-                    entities[ent.label_].append(ent.text)
-            
-            # Remove duplicates and empty lists
-            entities = {k: list(set(v)) for k, v in entities.items() if v}
-            
-            logger.debug(f"Extracted entities: {len(entities)} types")
-            return entities
+            return self._entities_from_doc(self.nlp(text[:5000]))
         
         except Exception as e:
-            logger.error(f"Error extracting entities: {e}")
+            logger.error("Error extracting entities: %s", e)
             return {}
     
+    def _entities_from_doc(self, doc: Any) -> Dict[str, List[str]]:
+        """
+        Collect named entities from a parsed spaCy doc.
+        
+        Args:
+            doc: Parsed spaCy Doc
+            
+        Returns:
+            Dictionary of entity types and their values
+        """
+        entities = {
+            'PERSON': [],
+            'ORG': [],
+            'GPE': [],  # Geopolitical entities (countries, cities)
+            'DATE': [],
+            'MONEY': [],
+            'PRODUCT': []
+        }
+        
+        for ent in doc.ents:
+            if ent.label_ in entities:
+                entities[ent.label_].append(ent.text)
+        
+        # Remove duplicates and empty lists
+        entities = {k: list(set(v)) for k, v in entities.items() if v}
+        
+        logger.debug("Extracted entities: %s types", len(entities))
+        return entities
+    
     def get_summary_sentences(self, text: str, num_sentences: int = 3) -> str:
         """
         Extract key sentences for a summary.
@@ -281,64 +447,74 @@ class ContentProcessor:
             return '. '.join(sentences) + '.'
         
         try:
-            doc = self.nlp(text[:3000])
-            
-            # Score sentences based on important words
-            sentence_scores = {}
-            
-            for sent in doc.sents:
-                score = 0
-                for token in sent:
-                    # Score based on parts of speech
-                    if token.pos_ in ['NOUN', 'PROPN', 'VERB']:
-                        score += 1
-                    if token.pos_ == 'ADJ':
-                        score += 0.5
-                
-                sentence_scores[sent.text] = score / len(sent)  # Normalize by length
-            
-            # Get top sentences
-            top_sentences = sorted(sentence_scores.items(), 
-                                 key=lambda x: x[1], 
-                                 reverse=True)[:num_sentences]
-            
-            # Sort by original order
-            summary = '. '.join([sent for sent, score in top_sentences])
-            
-            return summary
+            return self._summary_from_doc(self.nlp(text[:3000]), num_sentences)
         
         except Exception as e:
-            logger.error(f"Error generating summary: {e}")
+            logger.error("Error generating summary: %s", e)
             sentences = text.split('. ')[:num_sentences]
             return '. '.join(sentences) + '.'
     
-    def detect_sentiment(self, text: str) -> str:
+    def _summary_from_doc(self, doc: Any, num_sentences: int,
+                          max_chars: Optional[int] = None) -> str:
+        """
+        Build a summary from the highest-scoring sentences of a parsed doc.
+        
+        Args:
+            doc: Parsed spaCy Doc
+            num_sentences: Number of sentences to extract
+            max_chars: Only consider sentences starting before this offset
+            
+        Returns:
+            Summary text
+        """
+        sentences = []
+        for sent in doc.sents:
+            if max_chars is not None and sent.start_char >= max_chars:
+                break
+            sentences.append(sent)
+        
+        if not sentences:
+            return ''
+        
+        # Score tokens by part of speech, then sum per sentence from the
+        # running total at each sentence boundary
+        pos = doc.to_array(POS)
+        token_scores = np.where(np.isin(pos, (NOUN, PROPN, VERB)), 1.0,
+                                np.where(pos == ADJ, 0.5, 0.0))
+        cumulative = np.concatenate(([0.0], np.cumsum(token_scores)))
+        starts = np.fromiter((sent.start for sent in sentences), dtype=np.intp, count=len(sentences))
+        ends = np.fromiter((sent.end for sent in sentences), dtype=np.intp, count=len(sentences))
+        
+        # Normalize by length
+        sentence_scores = (cumulative[ends] - cumulative[starts]) / (ends - starts)
+        
+        # Get top sentences (stable, so ties keep document order)
+        top_indices = np.argsort(-sentence_scores, kind='stable')[:num_sentences]
+        
+        # Sort by original order
+        summary = '. '.join([sentences[i].text for i in sorted(top_indices.tolist())])
+        
+        return summary
+    
+    def detect_sentiment(self, text: str,
+                         token_counts: Optional[Counter] = None) -> str:
         """
         Detect sentiment of text (positive, negative, neutral).
         
         Args:
             text: Text to analyze
+            token_counts: Counter of the lowercase words in text (optional)
             
         Returns:
             Sentiment string
         """
         # Simple sentiment analysis based on positive/negative words
-        positive_words = {
-            'good', 'great', 'excellent', 'amazing', 'wonderful', 'best', 'love',
-            'like', 'enjoy', 'happy', 'positive', 'success', 'win', 'benefit',
-            'improve', 'better', 'perfect', 'fantastic', 'awesome', 'brilliant'
-        }
-        
-        negative_words = {
-            'bad', 'terrible', 'awful', 'worst', 'hate', 'dislike', 'poor',
-            'negative', 'fail', 'failure', 'problem', 'issue', 'wrong', 'worse',
-            'decline', 'loss', 'risk', 'threat', 'danger', 'crisis'
-        }
-        
-        text_lower = text.lower()
+        if token_counts is None:
+            token_counts = Counter(_WORD_RE.findall(text.lower()))
         
-        positive_count = sum(text_lower.count(word) for word in positive_words)
-        negative_count = sum(text_lower.count(word) for word in negative_words)
+        # Only sum the sentiment words that actually occur in the text
+        positive_count = sum(token_counts[word] for word in self.POSITIVE_WORDS & token_counts.keys())
+        negative_count = sum(token_counts[word] for word in self.NEGATIVE_WORDS & token_counts.keys())
         
         if positive_count > negative_count * 1.5:
             return 'positive'
@@ -347,6 +523,22 @@ class ContentProcessor:
         else:
             return 'neutral'
     
+    def categorize_only(self, article_data: Dict[str, Any]) -> str:
+        """
+        Categorize an article without running the spaCy analyses.
+        
+        Args:
+            article_data: Dictionary with article data (title, content, etc.)
+            
+        Returns:
+            Category name
+        """
+        return self.categorize_article(
+            article_data.get('title', ''),
+            article_data.get('content', ''),
+            article_data.get('description')
+        )
+    
     def analyze_article(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Complete analysis of an article.
@@ -354,6 +546,88 @@ class ContentProcessor:
         Args:
             article_data: Dictionary with article data (title, content, etc.)
             
+        Returns:
+            Dictionary with analysis results
+        """
+        return self.analyze_batch([article_data])[0]
+    
+    def analyze_batch(self, articles: List[Dict[str, Any]],
+                      batch_size: Optional[int] = None,
+                      n_process: int = 1) -> List[Dict[str, Any]]:
+        """
+        Analyze several articles, parsing each one with spaCy only once.
+        
+        Titles and contents are streamed through nlp.pipe. Each content doc is
+        reused for keywords, entities and the summary; title docs only need
+        POS tags for keywords.
+        
+        Args:
+            articles: List of article data dictionaries
+            batch_size: spaCy batch size (default: min(32, len(articles)))
+            n_process: spaCy worker processes; forking only pays off for
+                       large batches
+            
+        Returns:
+            List of analysis results, in the same order as articles
+        """
+        if not articles:
+            return []
+        
+        title_docs = content_docs = [None] * len(articles)
+        if self.nlp:
+            batch_size = batch_size or min(32, len(articles))
+            try:
+                # Titles only feed keyword extraction, so skip NER and
+                # sentence segmentation for them
+                title_disabled = [name for name in self.nlp.pipe_names
+                                  if name in ('ner', 'senter', 'sentencizer')]
+                title_docs = list(self.nlp.pipe(
+                    (a.get('title', '') for a in articles), batch_size=batch_size,
+                    disable=title_disabled, n_process=n_process
+                ))
+                content_docs = list(self.nlp.pipe(
+                    (a.get('content', '')[:5000] for a in articles), batch_size=batch_size,
+                    n_process=n_process
+                ))
+            except Exception as e:
+                logger.error("Error parsing articles with spaCy: %s", e)
+                title_docs = content_docs = [None] * len(articles)
+        
+        return [
+            self._analyze_parsed(article, title_doc, content_doc)
+            for article, title_doc, content_doc in zip(articles, title_docs, content_docs)
+        ]
+    
+    def reanalyze_all(self, articles: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Re-analyze a large set of stored articles (e.g. a bulk recategorization).
+        
+        Uses Config.SPACY_BATCH_SIZE and Config.SPACY_N_PROCESS. With
+        SPACY_N_PROCESS > 1 spaCy forks worker processes, so call this from a
+        script guarded by `if __name__ == '__main__'`, not per request.
+        
+        Args:
+            articles: Article data dictionaries
+            
+        Returns:
+            List of analysis results, in the same order as articles
+        """
+        return self.analyze_batch(
+            list(articles),
+            batch_size=Config.SPACY_BATCH_SIZE,
+            n_process=max(1, Config.SPACY_N_PROCESS)
+        )
+    
+    def _analyze_parsed(self, article_data: Dict[str, Any],
+                        title_doc: Any = None, content_doc: Any = None) -> Dict[str, Any]:
+        """
+        Analyze one article, reusing already-parsed spaCy docs when given.
+        
+        Args:
+            article_data: Dictionary with article data (title, content, etc.)
+            title_doc: Parsed title, or None if spaCy is unavailable
+            content_doc: Parsed content (first 5000 chars), or None
+            
         Returns:
             Dictionary with analysis results
         """
@@ -361,27 +635,44 @@ class ContentProcessor:
         content = article_data.get('content', '')
         description = article_data.get('description')
         
-        logger.info(f"Analyzing article: {title}")
+        logger.info("Analyzing article: %s", title)
+        
+        # Lowercase and tokenize once for all the keyword-based analyses
+        title_lower = title.lower()
+        content_lower = content.lower()
+        content_tokens = _WORD_RE.findall(content_lower)
+        
+        if content_doc is not None:
+            keywords = self._keywords_from_docs([title_doc, content_doc], max_keywords=10)
+        else:
+            keywords = self._extract_keywords_simple(
+                f"{title} {content}", max_keywords=10,
+                tokens=_WORD_RE.findall(title_lower) + content_tokens
+            )
         
         analysis = {
-            'category': self.categorize_article(title, content, description),
-            'keywords': self.extract_keywords(f"{title} {content}", max_keywords=10),
-            'sentiment': self.detect_sentiment(content),
+            'category': self.categorize_article(
+                title_lower, content_lower,
+                description.lower() if description else None,
+                normalized=True
+            ),
+            'keywords': keywords,
+            'sentiment': self.detect_sentiment(content, Counter(content_tokens)),
         }
         
-        # Extract entities if spaCy is available
-        if self.nlp:
-            entities = self.extract_entities(content)
+        # Extract entities and summary if spaCy parsed the content
+        if content_doc is not None:
+            entities = self._entities_from_doc(content_doc)
             if entities:
                 analysis['entities'] = entities
             
             # Generate summary
-            summary = self.get_summary_sentences(content, num_sentences=2)
+            summary = self._summary_from_doc(content_doc, num_sentences=2, max_chars=3000)
             if summary:
                 analysis['summary'] = summary
         
-        logger.info(f"Analysis complete: category={analysis['category']}, "
-                   f"keywords={len(analysis['keywords'])}, sentiment={analysis['sentiment']}")
+        logger.info("Analysis complete: category=%s, keywords=%s, sentiment=%s",
+                    analysis['category'], len(analysis['keywords']), analysis['sentiment'])
         
         return analysis
     
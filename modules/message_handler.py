@@ -11,10 +11,42 @@ from modules.scheduler import Scheduler
 
 logger = setup_logger(__name__)
 
+# Reply to an empty message
+_WELCOME = (
+    "👋 Hi! Send me URLs to save for later, or use commands like "
+    "'list', 'categories', or 'stats'."
+)
+
+# Reply to unrecognized input, around the quoted input text
+_UNKNOWN_PREFIX = "I'm not sure what to do with: \""
+_UNKNOWN_SUFFIX = (
+    "\"\n\n"
+    "💡 **I can help you with:**\n"
+    "• Saving URLs for later reading\n"
+    "• Organizing your reading queue\n"
+    "• Showing your reading statistics\n\n"
+    "Try sending me a URL or use commands like 'list', 'categories', or 'help'."
+)
+
 
 class MessageHandler:
     """Handles incoming messages from Telex and coordinates agent responses."""
     
+    # Exact-match commands and the handler method each one dispatches to
+    _COMMANDS = {
+        "list": "_handle_list_command",
+        "queue": "_handle_list_command",
+        "show": "_handle_list_command",
+        "categories": "_handle_categories_command",
+        "cats": "_handle_categories_command",
+        "stats": "_handle_stats_command",
+        "statistics": "_handle_stats_command",
+        "digest": "_handle_digest_command",
+        "summary": "_handle_digest_command",
+        "help": "_handle_help_command",
+        "?": "_handle_help_command",
+    }
+    
     def __init__(self):
         """Initialize message handler with required modules."""
         self.ingester = ContentIngester()
@@ -27,31 +59,21 @@ class MessageHandler:
         """Process incoming message and return appropriate response."""
         user_text = message_data.get("text", "").strip()
         if not user_text:
-            return (
-                "👋 Hi! Send me URLs to save for later, or use commands like "
-                "'list', 'categories', or 'stats'."
-            )
+            return _WELCOME
 
-        logger.info(f"Processing message: {user_text}")
+        logger.info("Processing message: %s", user_text)
         command = user_text.lower()
 
         # Commands
-        if command in ["list", "queue", "show"]:
-            return self._handle_list_command()
-        elif command in ["categories", "cats"]:
-            return self._handle_categories_command()
-        elif command in ["stats", "statistics"]:
-            return self._handle_stats_command()
-        elif command in ["digest", "summary"]:
-            return self._handle_digest_command()
-        elif command.startswith("suggest"):
+        handler = self._COMMANDS.get(command)
+        if handler:
+            return getattr(self, handler)()
+        if command.startswith("suggest"):
             parts = command.split()
             minutes = 30
             if len(parts) > 1 and parts[1].isdigit():
                 minutes = int(parts[1])
             return self._handle_suggest_command(minutes)
-        elif command in ["help", "?"]:
-            return self._handle_help_command()
 
         # URL handling
         urls = extract_urls_from_text(user_text) or []
@@ -65,57 +87,68 @@ class MessageHandler:
         if not urls:
             return "❌ No valid URLs found."
 
-        logger.info(f"Saving {len(urls)} URL(s)")
-        articles = self.ingester.fetch_multiple(urls) or []
+        logger.info("Saving %s URL(s)", len(urls))
 
-        if not articles:
+        # Categorize and save each article as soon as it is fetched, while
+        # the slower fetches are still in flight. Only the category is
+        # stored or shown, so skip the spaCy analyses.
+        saved_count = 0
+        fetched = []
+        for article in self.ingester.fetch_as_completed(urls):
+            article_dict = article.to_dict()
+            category = self.processor.categorize_only(article_dict)
+            article_dict["category"] = category
+            fetched.append((article, category))
+            article_id = self.storage.save_article(article_dict)
+            if article_id:
+                saved_count += 1
+                logger.info("Article saved with category: %s", category)
+
+        if not fetched:
             return (
                 "❌ Sorry, I couldn't fetch any of those articles. They might be:\n"
                 "• Behind a paywall\n• Requiring login\n• Temporarily unavailable\n\n"
                 "Please try a different URL."
             )
 
-        saved_count = 0
-        for article in articles:
-            analysis = self.processor.analyze_article(article.to_dict())
-            article_dict = article.to_dict()
-            article_dict["category"] = analysis.get("category", "Uncategorized")
-            article_id = self.storage.save_article(article_dict)
-            if article_id:
-                saved_count += 1
-                logger.info(f"Article saved with category: {article_dict['category']}")
+        # Report in the order the URLs were sent
+        url_order = {url: i for i, url in enumerate(dict.fromkeys(urls))}
+        fetched.sort(key=lambda pair: url_order.get(pair[0].url, len(urls)))
+        articles = [article for article, _ in fetched]
+        categories = [category for _, category in fetched]
 
         # Single article save
         if len(urls) == 1:
             article = articles[0] if articles else None
             if article and saved_count > 0:
-                analysis = self.processor.analyze_article(article.to_dict())
-                response = f"✅ Article saved!\n\n"
-                response += f"**{article.title}**\n"
-                response += f"📖 {article.reading_time} min read\n"
+                parts = [
+                    "✅ Article saved!\n\n",
+                    f"**{article.title}**\n",
+                    f"📖 {article.reading_time} min read\n",
+                ]
                 if article.author:
-                    response += f"✍️ By {article.author}\n"
-                response += f"📂 Category: {analysis.get('category', 'Uncategorized')}\n"
-                response += f"🔗 {article.url}\n\n"
-                response += "Added to your reading queue!"
-                return response
+                    parts.append(f"✍️ By {article.author}\n")
+                parts.append(f"📂 Category: {categories[0]}\n")
+                parts.append(f"🔗 {article.url}\n\n")
+                parts.append("Added to your reading queue!")
+                return "".join(parts)
             else:
                 return f"❌ Couldn't fetch or save the article from:\n📎 {urls[0]}"
 
         # Multiple article save
-        response = f"✅ Saved {saved_count} out of {len(urls)} articles!\n\n"
-        for i, article in enumerate(articles, 1):
-            if i <= 3:
-                analysis = self.processor.analyze_article(article.to_dict())
-                response += f"{i}. **{article.title}** ({article.reading_time} min)\n"
-                response += f"   📂 {analysis.get('category', 'Uncategorized')}\n"
-                response += f"   🔗 {article.url}\n"
+        parts = [f"✅ Saved {saved_count} out of {len(urls)} articles!\n\n"]
+        for i, (article, category) in enumerate(zip(articles[:3], categories), 1):
+            parts.append(
+                f"{i}. **{article.title}** ({article.reading_time} min)\n"
+                f"   📂 {category}\n"
+                f"   🔗 {article.url}\n"
+            )
         if len(articles) > 3:
-            response += f"\n...and {len(articles) - 3} more\n"
+            parts.append(f"\n...and {len(articles) - 3} more\n")
         if saved_count < len(urls):
             failed = len(urls) - saved_count
-            response += f"\n⚠️ {failed} article(s) couldn't be fetched."
-        return response
+            parts.append(f"\n⚠️ {failed} article(s) couldn't be fetched.")
+        return "".join(parts)
 
     def _handle_list_command(self) -> str:
         """Handle 'list' command to show reading queue."""
@@ -130,7 +163,7 @@ class MessageHandler:
                 return "📚 Your reading queue is empty!\n\nSend me URLs to get started."
 
             # Safe len() usage
-            response = f"📚 Your Prioritized Reading Queue ({len(articles)} articles):\n\n"
+            parts = [f"📚 Your Prioritized Reading Queue ({len(articles)} articles):\n\n"]
 
             for i, article in enumerate(articles, 1):
                 title = article.get("title", "Untitled")
@@ -138,21 +171,23 @@ class MessageHandler:
                 category = article.get("category", "Uncategorized")
                 url = article.get("url", "No URL")
 
-                response += f"{i}. **{title}** ({reading_time} min)\n"
-                response += f"   📂 {category}\n"
-
                 suggestion = self.scheduler.get_recommended_reading_time(article)
-                if suggestion:
-                    response += f"   💡 {suggestion}\n"
-                response += f"   🔗 {url}\n\n"
+                suggestion_line = f"   💡 {suggestion}\n" if suggestion else ""
+
+                parts.append(
+                    f"{i}. **{title}** ({reading_time} min)\n"
+                    f"   📂 {category}\n"
+                    f"{suggestion_line}"
+                    f"   🔗 {url}\n\n"
+                )
 
             next_delivery = self.scheduler.get_next_delivery_time()
             if next_delivery:
-                response += (
+                parts.append(
                     f"_Next digest scheduled for: "
                     f"{next_delivery.strftime('%I:%M %p, %A')}_"
                 )
-            return response
+            return "".join(parts)
 
         except Exception as e:
             logger.exception("Error handling list command")
@@ -168,14 +203,14 @@ class MessageHandler:
                 "📁 No categories yet!\n\nSave some articles to see them organized by category."
             )
 
-        response = "📁 Your Categories:\n\n"
+        parts = ["📁 Your Categories:\n\n"]
         for cat in categories:
-            response += (
+            parts.append(
                 f"**{cat.get('category', 'Uncategorized')}** "
                 f"({cat.get('count', 0)} articles)\n"
             )
-        response += f"\n_Total: {sum(c.get('count', 0) for c in categories)} articles_"
-        return response
+        parts.append(f"\n_Total: {sum(c.get('count', 0) for c in categories)} articles_")
+        return "".join(parts)
 
     def _handle_stats_command(self) -> str:
         """Handle 'stats' command."""
@@ -215,22 +250,24 @@ class MessageHandler:
 
     def _handle_suggest_command(self, minutes: int) -> str:
         """Handle 'suggest' command."""
-        logger.info(f"Handling suggest command for {minutes} minutes")
+        logger.info("Handling suggest command for %s minutes", minutes)
         articles = self.scheduler.suggest_reading_session(available_minutes=minutes) or []
 
         if not articles:
             return f"📚 No articles fit in {minutes} minutes.\n\nTry a longer time slot!"
 
         total_time = sum(a.get("reading_time", 0) for a in articles)
-        response = f"📚 **Reading Suggestions for {minutes} minutes**\n\n"
-        response += f"I found {len(articles)} articles ({total_time} min total):\n\n"
+        parts = [
+            f"📚 **Reading Suggestions for {minutes} minutes**\n\n",
+            f"I found {len(articles)} articles ({total_time} min total):\n\n",
+        ]
         for i, article in enumerate(articles, 1):
-            response += (
+            parts.append(
                 f"{i}. **{article.get('title', 'Untitled')}** "
                 f"({article.get('reading_time', '?')} min)\n"
+                f"   🔗 {article.get('url', 'No URL')}\n"
             )
-            response += f"   🔗 {article.get('url', 'No URL')}\n"
-        return response
+        return "".join(parts)
 
     def _handle_help_command(self) -> str:
         """Handle 'help' command."""
@@ -258,12 +295,5 @@ I learn from your reading patterns to deliver content at the best times! 📚"""
 
     def _handle_unknown_input(self, text: str) -> str:
         """Handle unrecognized input."""
-        logger.info(f"Unrecognized input: {text}")
-        return (
-            f"I'm not sure what to do with: \"{text}\"\n\n"
-            "💡 **I can help you with:**\n"
-            "• Saving URLs for later reading\n"
-            "• Organizing your reading queue\n"
-            "• Showing your reading statistics\n\n"
-            "Try sending me a URL or use commands like 'list', 'categories', or 'help'."
-        )
+        logger.info("Unrecognized input: %s", text)
+        return _UNKNOWN_PREFIX + text + _UNKNOWN_SUFFIX
@@ -4,12 +4,23 @@ Analyzes reading patterns and schedules optimal content delivery.
 """
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import Counter, defaultdict
+from collections import Counter
 import json
+import time
+from modules.storage import Storage
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Time period for each hour of the day (0-23)
+_HOUR_TO_CATEGORY = (
+    ('night',) * 6         # 12am - 5am
+    + ('morning',) * 6     # 6am - 11am
+    + ('afternoon',) * 6   # 12pm - 5pm
+    + ('evening',) * 5     # 6pm - 10pm
+    + ('night',)           # 11pm
+)
+
 
 class Scheduler:
     """
@@ -22,6 +33,17 @@ class Scheduler:
     DEFAULT_MAX_ITEMS_PER_DELIVERY = 5
     DEFAULT_MIN_HOURS_BETWEEN_DELIVERIES = 4
     
+    # How long analyzed reading patterns are reused (seconds)
+    PATTERNS_CACHE_TTL = 300
+    
+    # How long a prioritized queue is reused (seconds). Kept to the storage
+    # result cache's bound: write_version only sees this process's writes,
+    # so other workers' changes show up after this long at most.
+    QUEUE_CACHE_TTL = Storage.RESULT_CACHE_TTL
+    
+    # Longest session packed optimally; longer ones fall back to first-fit
+    MAX_KNAPSACK_MINUTES = 600
+    
     def __init__(self, storage):
         """
         Initialize scheduler with storage backend.
@@ -30,64 +52,72 @@ class Scheduler:
             storage: Storage instance for database access
         """
         self.storage = storage
+        self._patterns_cache = None
+        self._patterns_cache_at = 0.0
+        self._patterns_cache_version = None
+        self._pq_cache = None  # (computed_at, write_version, limit, articles)
         logger.info("Scheduler initialized")
     
     def analyze_reading_patterns(self) -> Dict[str, Any]:
         """
         Analyze user's reading patterns from history.
         
+        The result is cached for PATTERNS_CACHE_TTL seconds, or until the
+        storage reports a write.
+        
+        Returns:
+            Dictionary with reading pattern analysis
+        """
+        version = getattr(self.storage, 'write_version', None)
+        if (self._patterns_cache is not None
+                and version == self._patterns_cache_version
+                and time.monotonic() - self._patterns_cache_at < self.PATTERNS_CACHE_TTL):
+            return self._patterns_cache
+        
+        patterns = self._compute_reading_patterns()
+        self._patterns_cache = patterns
+        self._patterns_cache_at = time.monotonic()
+        self._patterns_cache_version = version
+        return patterns
+    
+    def _compute_reading_patterns(self) -> Dict[str, Any]:
+        """
+        Analyze reading patterns from the stored activity (uncached).
+        
         Returns:
             Dictionary with reading pattern analysis
         """
         logger.info("Analyzing reading patterns")
         
-        # Get reading activity
-        activity = self.storage.get_recent_activity(limit=100)
+        # Hour/weekday histograms of read events among the last 100 events,
+        # counted by SQLite
+        histograms = self.storage.get_read_histograms(limit=100)
         
-        if not activity:
+        if not histograms['total_reads']:
             logger.info("No reading activity yet")
             return self._get_default_patterns()
         
-        # Extract read events
-        read_events = [a for a in activity if a['event_type'] == 'read']
-        
-        if not read_events:
-            return self._get_default_patterns()
-        
-        # Analyze by hour
-        hours = []
-        days_of_week = []
-        
-        for event in read_events:
-            try:
-                timestamp = datetime.fromisoformat(event['timestamp'])
-                hours.append(timestamp.hour)
-                days_of_week.append(timestamp.weekday())  # 0=Monday, 6=Sunday
-            except Exception as e:
-                logger.warning(f"Error parsing timestamp: {e}")
-                continue
-        
         # Find most common reading hours
-        hour_counts = Counter(hours)
+        hour_counts = Counter(histograms['hours'])
         top_hours = [hour for hour, count in hour_counts.most_common(5)]
         
-        # Find most common reading days
-        day_counts = Counter(days_of_week)
+        # Find most common reading days (0=Monday, 6=Sunday)
+        day_counts = Counter(histograms['weekdays'])
         top_days = [day for day, count in day_counts.most_common(3)]
         
         # Categorize reading times
-        reading_times = self._categorize_reading_times(hours)
+        reading_times = self._categorize_reading_times(list(hour_counts.elements()))
         
         patterns = {
             'preferred_hours': top_hours or self.DEFAULT_DELIVERY_HOURS,
             'preferred_days': top_days,
             'reading_times': reading_times,
-            'total_reads': len(read_events),
+            'total_reads': histograms['total_reads'],
             'has_data': True
         }
         
-        logger.info(f"Patterns detected: preferred hours={top_hours}, "
-                   f"times={reading_times}")
+        logger.info("Patterns detected: preferred hours=%s, times=%s",
+                    top_hours, reading_times)
         
         return patterns
     
@@ -101,23 +131,7 @@ class Scheduler:
         Returns:
             List of time period strings
         """
-        time_categories = {
-            'morning': (6, 11),    # 6am - 11am
-            'afternoon': (12, 17),  # 12pm - 5pm
-            'evening': (18, 22),    # 6pm - 10pm
-            'night': (23, 5)        # 11pm - 5am (wraps around)
-        }
-        
-        category_counts = defaultdict(int)
-        
-        for hour in hours:
-            for category, (start, end) in time_categories.items():
-                if category == 'night':
-                    if hour >= 23 or hour <= 5:
-                        category_counts[category] += 1
-                else:
-                    if start <= hour <= end:
-                        category_counts[category] += 1
+        category_counts = Counter(_HOUR_TO_CATEGORY[hour] for hour in hours)
         
         # Return categories sorted by frequency
         sorted_categories = sorted(category_counts.items(), 
@@ -141,6 +155,21 @@ class Scheduler:
             'has_data': False
         }
     
+    def _get_preferred_hours(self) -> List[int]:
+        """
+        Get the user's preferred delivery hours without a full pattern analysis.
+        
+        Returns:
+            List of hours (0-23), most preferred first
+        """
+        version = getattr(self.storage, 'write_version', None)
+        if (self._patterns_cache is not None
+                and version == self._patterns_cache_version
+                and time.monotonic() - self._patterns_cache_at < self.PATTERNS_CACHE_TTL):
+            return self._patterns_cache['preferred_hours']
+        
+        return self.storage.get_top_read_hours(top=5, limit=100) or self.DEFAULT_DELIVERY_HOURS
+    
     def get_next_delivery_time(self) -> datetime:
         """
         Calculate next optimal delivery time based on patterns.
@@ -148,8 +177,7 @@ class Scheduler:
         Returns:
             Next delivery datetime
         """
-        patterns = self.analyze_reading_patterns()
-        preferred_hours = patterns['preferred_hours']
+        preferred_hours = self._get_preferred_hours()
         
         now = datetime.now()
         current_hour = now.hour
@@ -176,48 +204,62 @@ class Scheduler:
             microsecond=0
         )
         
-        logger.info(f"Next delivery scheduled for: {next_delivery}")
+        logger.info("Next delivery scheduled for: %s", next_delivery)
         return next_delivery
     
     def prioritize_queue(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get prioritized reading queue based on multiple factors.
         
+        The result is cached for QUEUE_CACHE_TTL seconds, or until the
+        storage reports a write, and smaller limits are served from it (the
+        ranking is deterministic, so they are a prefix). write_version only
+        counts this process's writes; with several workers (gunicorn -w),
+        a save or read through another worker can take up to
+        QUEUE_CACHE_TTL seconds to show here.
+        
         Args:
             limit: Maximum number of items to return
             
         Returns:
             List of prioritized articles (empty list if none)
         """
-        logger.info(f"Prioritizing queue (limit={limit})")
-        
-        # Get all unread articles
-        articles = self.storage.get_reading_queue(limit=50)
-        
-        if not articles:
-            return []  # Return empty list instead of None
-        
-        # Score each article
-        scored_articles = []
-        for article in articles:
-            score = self._calculate_priority_score(article)
-            scored_articles.append((score, article))
-        
-        # Sort by score (highest first)
-        scored_articles.sort(key=lambda x: x[0], reverse=True)
-        
-        # Return top N articles
-        prioritized = [article for score, article in scored_articles[:limit]]
-        
-        logger.info(f"Prioritized {len(prioritized)} articles")
-        return prioritized
+        version = getattr(self.storage, 'write_version', None)
+        cached = self._pq_cache
+        if (cached is not None
+                and cached[1] == version
+                and time.monotonic() - cached[0] < self.QUEUE_CACHE_TTL
+                # A short result already holds the whole queue
+                and (limit <= cached[2] or len(cached[3]) < cached[2])):
+            return cached[3][:limit]
+        
+        logger.info("Prioritizing queue (limit=%s)", limit)
+        
+        # Favorite category, looked up once for the whole queue
+        top_category = (self.storage.get_statistics() or {}).get('top_category')
+        
+        # Score the 50 most recent unread articles in SQL and keep the top N
+        prioritized = self.storage.get_prioritized_queue(
+            limit=limit, top_category=top_category, now=datetime.now()
+        ) or []  # Return empty list instead of None
+        
+        logger.info("Prioritized %s articles", len(prioritized))
+        self._pq_cache = (time.monotonic(), version, limit, prioritized)
+        return list(prioritized)
     
-    def _calculate_priority_score(self, article: Dict[str, Any]) -> float:
+    def _calculate_priority_score(self, article: Dict[str, Any],
+                                  top_category: Optional[str] = None,
+                                  now: Optional[datetime] = None) -> float:
         """
         Calculate priority score for an article.
         
+        prioritize_queue ranks in SQL via Storage.get_prioritized_queue, which
+        must apply the same rules; this is the single-article version.
+        
         Args:
             article: Article dictionary
+            top_category: User's most common category (from storage statistics)
+            now: Reference time for recency (default: current time)
             
         Returns:
             Priority score (higher = more important)
@@ -226,8 +268,10 @@ class Scheduler:
         
         # Factor 1: Recency (newer = higher priority)
         try:
-            saved_at = datetime.fromisoformat(article['saved_at'])
-            days_old = (datetime.now() - saved_at).days
+            saved_at_ts = article.get('saved_at_ts')
+            if saved_at_ts is None:
+                saved_at_ts = datetime.fromisoformat(article['saved_at']).timestamp()
+            days_old = int(((now or datetime.now()).timestamp() - saved_at_ts) // 86400)
             recency_score = max(0, 10 - days_old)  # Max 10 points, decreases over time
             score += recency_score
         except Exception:
@@ -242,9 +286,7 @@ class Scheduler:
         elif reading_time >= 15:
             score -= 2  # Long reads get penalty (may be intimidating)
         
-        # Factor 3: Category preferences (get from user stats)
-        stats = self.storage.get_statistics()
-        top_category = stats.get('top_category')
+        # Factor 3: Category preferences (from user stats)
         if top_category and article.get('category') == top_category:
             score += 5  # Bonus for favorite category
         
@@ -269,7 +311,7 @@ class Scheduler:
         Returns:
             Digest dictionary with articles grouped by category
         """
-        logger.info(f"Creating digest with {num_items} items")
+        logger.info("Creating digest with %s items", num_items)
         
         # Get prioritized articles
         articles = self.prioritize_queue(limit=num_items)
@@ -282,13 +324,13 @@ class Scheduler:
                 'created_at': datetime.now().isoformat()
             }
         
-        # Group by category
-        by_category = defaultdict(list)
+        # Group by category (a plain dict, so the digest needs no copy)
+        by_category = {}
         total_time = 0
         
         for article in articles:
             category = article.get('category', 'Uncategorized')
-            by_category[category].append(article)
+            by_category.setdefault(category, []).append(article)
             total_time += article.get('reading_time', 0)
         
         # Create digest
@@ -296,12 +338,12 @@ class Scheduler:
             'items': articles,
             'total_reading_time': total_time,
             'categories': list(by_category.keys()),
-            'by_category': dict(by_category),
+            'by_category': by_category,
             'created_at': datetime.now().isoformat()
         }
         
-        logger.info(f"Digest created: {len(articles)} items, "
-                   f"{total_time} min, {len(by_category)} categories")
+        logger.info("Digest created: %s items, %s min, %s categories",
+                    len(articles), total_time, len(by_category))
         
         return digest
     
@@ -312,8 +354,7 @@ class Scheduler:
         Returns:
             True if should send now, False otherwise
         """
-        patterns = self.analyze_reading_patterns()
-        preferred_hours = patterns['preferred_hours']
+        preferred_hours = self._get_preferred_hours()
         
         current_hour = datetime.now().hour
         
@@ -324,8 +365,8 @@ class Scheduler:
         # TODO: Implement last_sent tracking in storage
         # For now, just check preferred hours
         
-        logger.info(f"Should send digest now? {is_preferred_time} "
-                   f"(current_hour={current_hour}, preferred={preferred_hours})")
+        logger.info("Should send digest now? %s (current_hour=%s, preferred=%s)",
+                    is_preferred_time, current_hour, preferred_hours)
         
         return is_preferred_time
     
@@ -362,12 +403,33 @@ class Scheduler:
         Returns:
             List of articles that fit in the time slot
         """
-        logger.info(f"Suggesting reading session for {available_minutes} minutes")
+        logger.info("Suggesting reading session for %s minutes", available_minutes)
         
         # Get prioritized queue
         articles = self.prioritize_queue(limit=20)
         
-        # Select articles that fit in time
+        if available_minutes > self.MAX_KNAPSACK_MINUTES:
+            selected = self._select_greedy(articles, available_minutes)
+        else:
+            selected = self._select_knapsack(articles, available_minutes)
+        time_used = sum(article.get('reading_time', 5) for article in selected)
+        
+        logger.info("Suggested %s articles for %s/%s min", len(selected), time_used, available_minutes)
+        
+        return selected
+    
+    def _select_greedy(self, articles: List[Dict[str, Any]],
+                       available_minutes: int) -> List[Dict[str, Any]]:
+        """
+        Select articles first-fit in queue order.
+        
+        Args:
+            articles: Prioritized articles
+            available_minutes: Minutes available for reading
+            
+        Returns:
+            List of articles that fit in the time slot
+        """
         selected = []
         time_used = 0
         
@@ -377,10 +439,53 @@ class Scheduler:
                 selected.append(article)
                 time_used += reading_time
         
-        logger.info(f"Suggested {len(selected)} articles for {time_used}/{available_minutes} min")
-        
         return selected
     
+    def _select_knapsack(self, articles: List[Dict[str, Any]],
+                         available_minutes: int) -> List[Dict[str, Any]]:
+        """
+        Select the articles with the highest total priority that fit in time
+        (0/1 knapsack over whole minutes).
+        
+        Args:
+            articles: Prioritized articles
+            available_minutes: Minutes available for reading
+            
+        Returns:
+            List of articles that fit in the time slot, in queue order
+        """
+        capacity = max(0, available_minutes)
+        top_category = (self.storage.get_statistics() or {}).get('top_category')
+        now = datetime.now()
+        
+        # best[t] = highest total value using at most t minutes
+        best = [0.0] * (capacity + 1)
+        taken = []  # taken[i][t]: article i is part of best[t] after row i
+        
+        for article in articles:
+            reading_time = max(0, article.get('reading_time', 5))
+            # Every article is worth at least 1 so the slot is filled when
+            # scores tie or go negative (as the greedy fill would)
+            value = max(0.0, self._calculate_priority_score(article, top_category, now)) + 1
+            row = [False] * (capacity + 1)
+            for t in range(capacity, reading_time - 1, -1):
+                candidate = best[t - reading_time] + value
+                if candidate > best[t]:
+                    best[t] = candidate
+                    row[t] = True
+            taken.append(row)
+        
+        # Walk back through the rows to recover the chosen articles
+        chosen = []
+        t = capacity
+        for i in range(len(articles) - 1, -1, -1):
+            if taken[i][t]:
+                chosen.append(articles[i])
+                t -= max(0, articles[i].get('reading_time', 5))
+        chosen.reverse()
+        
+        return chosen
+    
     def get_delivery_schedule(self, days_ahead: int = 7) -> List[Dict[str, Any]]:
         """
         Generate a delivery schedule for upcoming days.
@@ -391,10 +496,9 @@ class Scheduler:
         Returns:
             List of scheduled delivery times with content suggestions
         """
-        logger.info(f"Generating delivery schedule for {days_ahead} days")
+        logger.info("Generating delivery schedule for %s days", days_ahead)
         
-        patterns = self.analyze_reading_patterns()
-        preferred_hours = patterns['preferred_hours']
+        preferred_hours = self._get_preferred_hours()
         
         schedule = []
         current_date = datetime.now()
@@ -413,7 +517,7 @@ class Scheduler:
                         'recommended_items': self.DEFAULT_MAX_ITEMS_PER_DELIVERY
                     })
         
-        logger.info(f"Generated {len(schedule)} scheduled deliveries")
+        logger.info("Generated %s scheduled deliveries", len(schedule))
         return schedule
     
     def get_optimal_batch_size(self) -> int:
@@ -453,27 +557,26 @@ class Scheduler:
         if not items:
             return "📚 Your reading queue is empty! Add some articles to get started."
         
-        message = f"📚 **Your Reading Digest** ({len(items)} articles, {total_time} min)\n\n"
+        parts = [f"📚 **Your Reading Digest** ({len(items)} articles, {total_time} min)\n\n"]
         
         # Group by category
         by_category = digest.get('by_category', {})
         
         for category, articles in by_category.items():
-            message += f"**{category}**\n"
+            parts.append(f"**{category}**\n")
             for article in articles:
-                message += f"• {article['title']} ({article['reading_time']} min)\n"
-                message += f"  {article['url']}\n"
-            message += "\n"
+                parts.append(f"• {article['title']} ({article['reading_time']} min)\n  {article['url']}\n")
+            parts.append("\n")
         
         # Add reading time suggestion
         if total_time <= 15:
-            message += "💡 Perfect for a quick session!"
+            parts.append("💡 Perfect for a quick session!")
         elif total_time <= 30:
-            message += "💡 Great for your lunch break!"
+            parts.append("💡 Great for your lunch break!")
         else:
-            message += "💡 Set aside some time for this one!"
+            parts.append("💡 Set aside some time for this one!")
         
-        return message
+        return "".join(parts)
     
     # ==================================================================
     # CALENDAR INTEGRATION (OPTIONAL)
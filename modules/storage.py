@@ -2,59 +2,514 @@
 Storage Module - SQLite database management for articles and user data.
 """
 import sqlite3
+import atexit
+import copy
+import os
+import queue
+import threading
+import functools
+import time
 from typing import Optional, List, Dict, Any
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from collections import OrderedDict
 from contextlib import contextmanager
 from utils.logger import setup_logger
 from config.config import Config
 
 logger = setup_logger(__name__)
 
+# Per-connection settings, applied when a connection opens. NORMAL sync
+# is durable under WAL except across power loss; negative cache_size is KiB.
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA busy_timeout=30000',
+)
+
+# SQL for the query methods, kept as module constants so every call passes
+# the identical string and hits the connection's statement cache
+_SQL_INSERT_ARTICLE = '''
+    INSERT INTO articles (
+        url, title, content, author, published_date,
+        description, reading_time, domain, fetched_at, saved_at,
+        saved_at_ts
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO NOTHING
+'''
+_SQL_GET_ARTICLE_ID_BY_URL = 'SELECT id FROM articles WHERE url = ?'
+_SQL_LOG_EVENT = '''
+    INSERT INTO reading_stats (article_id, event_type, timestamp, metadata)
+    VALUES (?, ?, ?, ?)
+'''
+_SQL_GET_ARTICLE = 'SELECT * FROM articles WHERE id = ?'
+_SQL_GET_ARTICLE_BY_URL = 'SELECT * FROM articles WHERE url = ?'
+_SQL_GET_READING_QUEUE = '''
+    SELECT * FROM articles
+    WHERE status = ?
+    ORDER BY saved_at DESC, id DESC
+    LIMIT ?
+'''
+_SQL_GET_READING_QUEUE_BEFORE = '''
+    SELECT * FROM articles
+    WHERE status = ? AND (saved_at, id) < (?, ?)
+    ORDER BY saved_at DESC, id DESC
+    LIMIT ?
+'''
+_SQL_GET_PRIORITIZED_QUEUE = '''
+    SELECT articles.* FROM (
+        SELECT id, saved_at, (
+            COALESCE(MAX(0, 10 - (? - saved_at_ts) / 86400), 0)
+            + CASE WHEN reading_time <= 3 THEN 5
+                   WHEN reading_time <= 5 THEN 3
+                   WHEN reading_time >= 15 THEN -2
+                   ELSE 0 END
+            + CASE WHEN category = ? THEN 5 ELSE 0 END
+            + CASE WHEN author IS NOT NULL AND author != '' THEN 2 ELSE 0 END
+            + CASE WHEN length(description) > 100 THEN 2 ELSE 0 END
+        ) AS score
+        FROM (
+            SELECT id, saved_at, saved_at_ts, reading_time, category, author, description
+            FROM articles
+            WHERE status = 'unread'
+            ORDER BY saved_at DESC, id DESC
+            LIMIT ?
+        )
+        ORDER BY score DESC, saved_at DESC, id DESC
+        LIMIT ?
+    ) AS top
+    JOIN articles ON articles.id = top.id
+    ORDER BY top.score DESC, top.saved_at DESC, top.id DESC
+'''
+_SQL_GET_ARTICLES_BY_CATEGORY = '''
+    SELECT * FROM articles
+    WHERE category = ?
+    ORDER BY saved_at DESC, id DESC
+    LIMIT ?
+'''
+_SQL_GET_ARTICLES_BY_CATEGORY_BEFORE = '''
+    SELECT * FROM articles
+    WHERE category = ? AND (saved_at, id) < (?, ?)
+    ORDER BY saved_at DESC, id DESC
+    LIMIT ?
+'''
+_SQL_GET_ALL_CATEGORIES = '''
+    SELECT category, count FROM category_counts
+    ORDER BY count DESC, category
+'''
+_SQL_MARK_READ = '''
+    UPDATE articles
+    SET status = 'read', read_at = ?
+    WHERE id = ? AND status IS NOT 'read'
+'''
+_SQL_UPDATE_CATEGORY = '''
+    UPDATE articles
+    SET category = ?
+    WHERE id = ? AND category IS NOT ?
+'''
+_SQL_ARTICLE_EXISTS = 'SELECT 1 FROM articles WHERE id = ?'
+_SQL_DELETE_ARTICLE = 'DELETE FROM articles WHERE id = ?'
+_SQL_GET_COUNTERS = 'SELECT key, value FROM stats_counters'
+_SQL_TOP_CATEGORY = '''
+    SELECT category FROM category_counts
+    ORDER BY count DESC, category
+    LIMIT 1
+'''
+_SQL_SEARCH_ARTICLES = '''
+    SELECT * FROM articles
+    WHERE title LIKE ? OR content LIKE ?
+    ORDER BY saved_at DESC
+    LIMIT ?
+'''
+_SQL_SEARCH_ARTICLES_FTS = '''
+    SELECT a.* FROM articles_fts f
+    JOIN articles a ON a.id = f.rowid
+    WHERE articles_fts MATCH ?
+    ORDER BY f.rank
+    LIMIT ?
+'''
+_SQL_GET_PREFERENCE = 'SELECT value FROM user_preferences WHERE key = ?'
+_SQL_SET_PREFERENCE = '''
+    INSERT OR REPLACE INTO user_preferences (key, value, updated_at)
+    VALUES (?, ?, ?)
+'''
+_SQL_GET_RECENT_ACTIVITY = '''
+    SELECT rs.*, a.title, a.url
+    FROM reading_stats rs
+    JOIN articles a ON rs.article_id = a.id
+    ORDER BY rs.timestamp DESC, rs.id DESC
+    LIMIT ?
+'''
+_SQL_GET_RECENT_ACTIVITY_BEFORE = '''
+    SELECT rs.*, a.title, a.url
+    FROM reading_stats rs
+    JOIN articles a ON rs.article_id = a.id
+    WHERE (rs.timestamp, rs.id) < (?, ?)
+    ORDER BY rs.timestamp DESC, rs.id DESC
+    LIMIT ?
+'''
+_SQL_READ_HISTOGRAMS = '''
+    WITH recent AS (
+        SELECT rs.event_type, rs.timestamp
+        FROM reading_stats rs
+        JOIN articles a ON rs.article_id = a.id
+        ORDER BY rs.timestamp DESC
+        LIMIT ?
+    )
+    SELECT CAST(strftime('%H', timestamp) AS INTEGER) AS hour,
+           CAST(strftime('%w', timestamp) AS INTEGER) AS weekday,
+           COUNT(*) AS count, MAX(timestamp) AS latest
+    FROM recent
+    WHERE event_type = 'read'
+    GROUP BY hour, weekday
+    ORDER BY latest DESC
+'''
+_SQL_TOP_READ_HOURS = '''
+    WITH recent AS (
+        SELECT rs.event_type, rs.timestamp
+        FROM reading_stats rs
+        JOIN articles a ON rs.article_id = a.id
+        ORDER BY rs.timestamp DESC
+        LIMIT ?
+    )
+    SELECT CAST(strftime('%H', timestamp) AS INTEGER) AS hour
+    FROM recent
+    WHERE event_type = 'read' AND hour IS NOT NULL
+    GROUP BY hour
+    ORDER BY COUNT(*) DESC, MAX(timestamp) DESC
+    LIMIT ?
+'''
+_SQL_DELETE_OLD_READ_ARTICLES = '''
+    DELETE FROM articles
+    WHERE id IN (
+        SELECT id FROM articles INDEXED BY idx_articles_read_at
+        WHERE status = 'read' AND read_at < ?
+        LIMIT ?
+    )
+'''
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    """
+    Fetch the remaining rows of a query as dictionaries.
+    
+    Rows come back as plain tuples and are zipped with the column names,
+    read once per query, instead of building a sqlite3.Row per row and
+    converting it with dict(row).
+    
+    Args:
+        cursor: Cursor with an executed query
+        
+    Returns:
+        List of row dictionaries
+    """
+    cursor.row_factory = None
+    columns = tuple(column[0] for column in cursor.description)
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _fetch_dict(cursor: sqlite3.Cursor) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the next row of a query as a dictionary.
+    
+    Args:
+        cursor: Cursor with an executed query
+        
+    Returns:
+        Row dictionary, or None if there are no more rows
+    """
+    cursor.row_factory = None
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return dict(zip((column[0] for column in cursor.description), row))
+
+
+def _version_cached(method):
+    """
+    Cache a read method's result per arguments until the next write.
+    
+    Entries are dropped once Storage.write_version moves on, and expire
+    after Storage.RESULT_CACHE_TTL seconds regardless (another process may
+    have written to the same database). At most RESULT_CACHE_SIZE entries
+    are kept, least recently used evicted first. Callers get a shallow copy.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        with self._result_cache_lock:
+            if self._result_cache_version != self.write_version:
+                self._result_cache.clear()
+                self._result_cache_version = self.write_version
+            
+            cached = self._result_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.RESULT_CACHE_TTL:
+                self._result_cache.move_to_end(key)
+                return copy.copy(cached[1])
+        
+        version = self.write_version
+        result = method(self, *args, **kwargs)
+        with self._result_cache_lock:
+            # Don't cache a result that a concurrent write may have outdated
+            if version == self.write_version == self._result_cache_version:
+                self._result_cache[key] = (time.monotonic(), result)
+                self._result_cache.move_to_end(key)
+                if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        return copy.copy(result)
+    
+    return wrapper
+
 
 class Storage:
     """Manages SQLite database for storing articles and user preferences."""
     
-    def __init__(self, db_path: Optional[str] = None):
+    # How long cached read results are reused at most (seconds)
+    RESULT_CACHE_TTL = 5
+    
+    # Most cached read results kept at once
+    RESULT_CACHE_SIZE = 1024
+    
+    # WAL size that triggers an explicit checkpoint (bytes)
+    WAL_CHECKPOINT_BYTES = 64 * 1024 * 1024
+    
+    # Number of pooled read-only connections
+    READER_POOL_SIZE = 4
+    
+    # Most queued events written per transaction by the event writer
+    EVENT_BATCH_SIZE = 100
+    
+    # Most articles deleted per transaction by cleanup_old_articles
+    CLEANUP_BATCH_SIZE = 500
+    
+    # Prepared statements kept per connection
+    STATEMENT_CACHE_SIZE = 256
+    
+    def __init__(self, db_path: Optional[str] = None, fast: bool = False):
         """
         Initialize storage with database connection.
         
         Args:
             db_path: Path to SQLite database file (default from config)
+            fast: Skip fsync on commit (synchronous=OFF), for throwaway
+                databases such as in tests; a crash can corrupt the file
         """
         self.db_path = db_path or Config.DATABASE_PATH
+        self.fast = fast
+        # Bumped after every committed write that changed rows, so callers
+        # can invalidate derived caches
+        self.write_version = 0
+        self._result_cache = OrderedDict()  # (method, args, kwargs) -> (computed_at, result)
+        self._result_cache_version = 0
+        self._result_cache_lock = threading.Lock()
         self._ensure_database_directory()
+        
+        # One writer, serialized by a lock (re-entrant for nested writes)
+        self._writer_conn = self._connect()
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
         self._init_database()
-        logger.info(f"Storage initialized with database: {self.db_path}")
+        
+        # Readers run concurrently with each other and with the writer
+        self._reader_pool = queue.Queue(maxsize=self.READER_POOL_SIZE)
+        for _ in range(self.READER_POOL_SIZE):
+            self._reader_pool.put(self._connect(read_only=True))
+        
+        # Reading events are written off the caller's path, in batches
+        self._event_queue = queue.Queue()
+        self._event_thread = threading.Thread(target=self._event_writer,
+                                              name='storage-events', daemon=True)
+        self._event_thread.start()
+        
+        atexit.register(self.close)
+        logger.info("Storage initialized with database: %s", self.db_path)
     
     def _ensure_database_directory(self):
         """Create database directory if it doesn't exist."""
         db_dir = Path(self.db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
     
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a database connection with the standard settings.
+        
+        Args:
+            read_only: Open the file read-only (for the reader pool)
+        
+        Returns:
+            sqlite3.Connection in autocommit mode (transactions are explicit)
+        """
+        if read_only:
+            # Private cache: each reader has its own page cache and locks
+            target, uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro&cache=private", True
+        else:
+            target, uri = self.db_path, False
+        
+        conn = sqlite3.connect(
+            target,
+            timeout=30.0,  # 30 second timeout
+            check_same_thread=False,  # Connections are shared between threads
+            isolation_level=None,
+            uri=uri,
+            cached_statements=self.STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        if not read_only:
+            # WAL lets readers run alongside the writer; the mode persists
+            # in the database file
+            conn.execute('PRAGMA journal_mode=WAL')
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if self.fast and not read_only:
+            conn.execute('PRAGMA synchronous=OFF')
+        if read_only:
+            # Reject writes in SQL too, not just at the file level
+            conn.execute('PRAGMA query_only=ON')
+        return conn
+    
     @contextmanager
-    def _get_connection(self):
+    def _write_ctx(self):
         """
-        Context manager for database connections.
+        Context manager for a write transaction on the single writer connection.
+        
+        Holds the writer lock for the whole transaction and takes SQLite's
+        write lock up front (BEGIN IMMEDIATE), so it cannot fail to upgrade
+        from a read. Nested uses join the outermost transaction, which
+        commits or rolls back when it exits; write_version is bumped after
+        a commit that changed any rows.
         
         Yields:
-            sqlite3.Connection: Database connection
+            sqlite3.Connection: Writer connection
         """
-        conn = sqlite3.connect(self.db_path, timeout=30.0)  # 30 second timeout
-        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        with self._write_lock:
+            conn = self._writer_conn
+            if self._write_depth:
+                self._write_depth += 1
+                try:
+                    yield conn
+                finally:
+                    self._write_depth -= 1
+                return
+            
+            conn.execute('BEGIN IMMEDIATE')
+            self._write_depth = 1
+            changes = conn.total_changes
+            try:
+                yield conn
+                conn.execute('COMMIT')
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                logger.error("Database error: %s", e, exc_info=True)
+                raise
+            else:
+                # Bumped only once the changes are visible to readers: a read
+                # that raced the commit saw the old version, so its result
+                # is either dropped with it or fails the version check
+                if conn.total_changes != changes:
+                    self.write_version += 1
+                self._maybe_checkpoint(conn)
+            finally:
+                self._write_depth = 0
+    
+    @contextmanager
+    def _read_ctx(self):
+        """
+        Context manager for a read transaction on a pooled reader connection.
+        
+        Under WAL, readers see the last committed snapshot and never block
+        on (or block) the writer. Waits for a free reader if all are busy.
+        
+        Yields:
+            sqlite3.Connection: Read-only connection
+        """
+        conn = self._reader_pool.get()
         try:
-            yield conn
-            conn.commit()
+            conn.execute('BEGIN')
+            try:
+                yield conn
+            finally:
+                conn.execute('COMMIT')
         except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}", exc_info=True)
+            logger.error("Database error: %s", e, exc_info=True)
             raise
         finally:
-            conn.close()
+            self._reader_pool.put(conn)
+    
+    def close(self):
+        """Write pending events, then close the writer and every pooled reader connection."""
+        if not self._event_thread.is_alive():
+            return  # Already closed
+        self.flush()
+        self._event_queue.put(None)
+        self._event_thread.join()
+        with self._write_lock:
+            self._writer_conn.close()
+        while True:
+            try:
+                self._reader_pool.get_nowait().close()
+            except queue.Empty:
+                break
+    
+    def flush(self):
+        """Block until every queued reading event has been written."""
+        self._event_queue.join()
+    
+    def _event_writer(self):
+        """
+        Write queued reading events until a None sentinel arrives.
+        
+        Waits for one event, then takes whatever else is already queued (up
+        to EVENT_BATCH_SIZE), so a burst of events shares one transaction.
+        A single consumer keeps events in the order they were logged.
+        """
+        while True:
+            batch = [self._event_queue.get()]
+            while len(batch) < self.EVENT_BATCH_SIZE and batch[-1] is not None:
+                try:
+                    batch.append(self._event_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = batch[-1] is None
+            events = batch[:-1] if stop else batch
+            try:
+                if events:
+                    with self._write_ctx() as conn:
+                        conn.executemany(_SQL_LOG_EVENT, events)
+            except Exception as e:
+                logger.error("Error logging %s events: %s", len(events), e)
+            finally:
+                for _ in batch:
+                    self._event_queue.task_done()
+            
+            if stop:
+                return
+    
+    def _maybe_checkpoint(self, conn: sqlite3.Connection):
+        """
+        Checkpoint the write-ahead log once it grows past WAL_CHECKPOINT_BYTES.
+        
+        Automatic checkpoints can be starved by overlapping readers, letting
+        the WAL grow without bound; RESTART waits for them and rewinds it.
+        
+        Args:
+            conn: Open connection with no pending transaction
+        """
+        try:
+            wal_size = os.path.getsize(f"{self.db_path}-wal")
+        except OSError:
+            return  # No WAL file (not in WAL mode, or nothing written yet)
+        
+        if wal_size > self.WAL_CHECKPOINT_BYTES:
+            logger.info("Checkpointing %s byte WAL", wal_size)
+            conn.execute('PRAGMA wal_checkpoint(RESTART)')
     
     def _init_database(self):
         """Initialize database schema if not exists."""
-        with self._get_connection() as conn:
+        with self._write_ctx() as conn:
             cursor = conn.cursor()
             
             # Articles table
@@ -71,6 +526,7 @@ class Storage:
                     domain TEXT NOT NULL,
                     fetched_at TEXT NOT NULL,
                     saved_at TEXT NOT NULL,
+                    saved_at_ts INTEGER,
                     status TEXT DEFAULT 'unread',
                     category TEXT DEFAULT 'Uncategorized',
                     tags TEXT,
@@ -79,17 +535,40 @@ class Storage:
                 )
             ''')
             
-            # Create indexes for common queries
+            # Older databases predate saved_at_ts; add and backfill it
+            # (saved_at is local time, saved_at_ts is Unix seconds)
+            columns = {row['name'] for row in cursor.execute('PRAGMA table_info(articles)')}
+            if 'saved_at_ts' not in columns:
+                cursor.execute('ALTER TABLE articles ADD COLUMN saved_at_ts INTEGER')
+                cursor.execute('''
+                    UPDATE articles 
+                    SET saved_at_ts = CAST(strftime('%s', saved_at, 'utc') AS INTEGER)
+                ''')
+            
+            # Create indexes for common queries. Listing by status or category
+            # is newest first (id breaks ties, for keyset paging), so both
+            # indexes carry saved_at and id and need no sort.
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_articles_status 
-                ON articles(status)
+                CREATE INDEX IF NOT EXISTS idx_articles_status_saved_id 
+                ON articles(status, saved_at DESC, id DESC)
             ''')
             
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_articles_category 
-                ON articles(category)
+                CREATE INDEX IF NOT EXISTS idx_articles_category_saved_id 
+                ON articles(category, saved_at DESC, id DESC)
             ''')
             
+            # Only read articles are ever looked up by read time (cleanup)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_articles_read_at 
+                ON articles(read_at) WHERE status = 'read'
+            ''')
+            
+            # Superseded by the composite indexes above
+            for index in ('idx_articles_status', 'idx_articles_category',
+                          'idx_articles_status_saved', 'idx_articles_category_saved'):
+                cursor.execute(f'DROP INDEX IF EXISTS {index}')
+            
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_articles_saved_at 
                 ON articles(saved_at DESC)
@@ -116,8 +595,179 @@ class Storage:
                 )
             ''')
             
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_reading_stats_timestamp_id 
+                ON reading_stats(timestamp DESC, id DESC)
+            ''')
+            
+            # Full-text index over title and content, kept in sync by triggers
+            self._has_fts = self._init_fts(cursor)
+            
+            # Article counts and reading time totals, kept up to date by triggers
+            self._init_counters(cursor)
+            
+            # Give the query planner index statistics on first run
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            )
+            if cursor.fetchone() is None:
+                cursor.execute('ANALYZE')
+            
             logger.info("Database schema initialized")
     
+    def _init_counters(self, cursor: sqlite3.Cursor):
+        """
+        Create the running totals read by get_statistics and get_all_categories.
+        
+        stats_counters holds article counts and reading time totals, and
+        category_counts the number of articles per category. Triggers on
+        articles keep both in step with every insert, delete and update, so
+        reading them is a few point lookups instead of full-table aggregates.
+        
+        Args:
+            cursor: Cursor inside the schema transaction
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_counters'"
+        )
+        exists = cursor.fetchone() is not None
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_counters (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS category_counts (
+                category TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        
+        # Seed from the articles saved so far
+        if not exists:
+            cursor.execute('''
+                INSERT INTO stats_counters (key, value)
+                SELECT 'total_articles', COUNT(*) FROM articles
+                UNION ALL SELECT 'unread', COUNT(*) FROM articles WHERE status = 'unread'
+                UNION ALL SELECT 'read', COUNT(*) FROM articles WHERE status = 'read'
+                UNION ALL SELECT 'total_reading_time', COALESCE(SUM(reading_time), 0) FROM articles
+                UNION ALL SELECT 'read_reading_time', COALESCE(SUM(reading_time), 0)
+                          FROM articles WHERE status = 'read'
+            ''')
+            cursor.execute('''
+                INSERT OR REPLACE INTO category_counts (category, count)
+                SELECT category, COUNT(*) FROM articles GROUP BY category
+            ''')
+        
+        # What one article row adds to each counter
+        def contribution(row: str) -> str:
+            return f'''CASE key
+                WHEN 'total_articles' THEN 1
+                WHEN 'unread' THEN {row}.status = 'unread'
+                WHEN 'read' THEN {row}.status = 'read'
+                WHEN 'total_reading_time' THEN {row}.reading_time
+                WHEN 'read_reading_time' THEN
+                    CASE WHEN {row}.status = 'read' THEN {row}.reading_time ELSE 0 END
+            END'''
+        
+        add_category = '''
+            INSERT INTO category_counts (category, count) VALUES (new.category, 1)
+            ON CONFLICT(category) DO UPDATE SET count = count + 1;
+        '''
+        remove_category = '''
+            UPDATE category_counts SET count = count - 1 WHERE category = old.category;
+            DELETE FROM category_counts WHERE category = old.category AND count <= 0;
+        '''
+        
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS articles_counters_insert AFTER INSERT ON articles
+            BEGIN
+                UPDATE stats_counters SET value = value + {contribution('new')};
+                {add_category}
+            END
+        ''')
+        
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS articles_counters_delete AFTER DELETE ON articles
+            BEGIN
+                UPDATE stats_counters SET value = value - {contribution('old')};
+                {remove_category}
+            END
+        ''')
+        
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS articles_counters_update
+            AFTER UPDATE OF status, reading_time, category ON articles
+            BEGIN
+                UPDATE stats_counters
+                SET value = value - {contribution('old')} + {contribution('new')};
+                {remove_category}
+                {add_category}
+            END
+        ''')
+    
+    def _init_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the FTS5 index used by search_articles, if SQLite supports it.
+        
+        Args:
+            cursor: Cursor inside the schema transaction
+            
+        Returns:
+            True if the index is available, False to fall back to LIKE search
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+        )
+        exists = cursor.fetchone() is not None
+        
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                    title, content,
+                    content='articles', content_rowid='id',
+                    tokenize='porter unicode61'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            logger.warning("FTS5 unavailable, search will scan articles: %s", e)
+            return False
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles
+            BEGIN
+                INSERT INTO articles_fts (rowid, title, content)
+                VALUES (new.id, new.title, new.content);
+            END
+        ''')
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles
+            BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, content)
+                VALUES ('delete', old.id, old.title, old.content);
+            END
+        ''')
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, content ON articles
+            BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, content)
+                VALUES ('delete', old.id, old.title, old.content);
+                INSERT INTO articles_fts (rowid, title, content)
+                VALUES (new.id, new.title, new.content);
+            END
+        ''')
+        
+        # Index articles saved before the index existed
+        if not exists:
+            cursor.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+        
+        return True
+    
     def save_article(self, article_data: Dict[str, Any]) -> Optional[int]:
         """
         Save an article to the database.
@@ -128,56 +778,75 @@ class Storage:
         Returns:
             Article ID if saved successfully, None otherwise
         """
+        return self.save_articles([article_data])[0]
+    
+    def save_articles(self, articles: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Save several articles in a single transaction.
+        
+        Already-saved URLs keep their existing row. If any article fails,
+        none of the batch is saved.
+        
+        Args:
+            articles: Dictionaries containing article data
+            
+        Returns:
+            Article IDs in input order (all None if the batch failed)
+        """
+        if not articles:
+            return []
+        
         try:
-            with self._get_connection() as conn:
+            with self._write_ctx() as conn:
                 cursor = conn.cursor()
+                now = datetime.now()
+                saved_at = now.isoformat()
+                saved_at_ts = int(now.timestamp())
                 
-                # Check if article already exists
-                cursor.execute('SELECT id FROM articles WHERE url = ?', 
-                             (article_data['url'],))
-                existing = cursor.fetchone()
-                
-                if existing:
-                    logger.info(f"Article already exists: {article_data['url']}")
-                    return existing['id']
-                
-                # Insert new article
-                cursor.execute('''
-                    INSERT INTO articles (
-                        url, title, content, author, published_date,
-                        description, reading_time, domain, fetched_at, saved_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    article_data['url'],
-                    article_data['title'],
-                    article_data['content'],
-                    article_data.get('author'),
-                    article_data.get('published_date'),
-                    article_data.get('description'),
-                    article_data['reading_time'],
-                    article_data['domain'],
-                    article_data['fetched_at'],
-                    datetime.now().isoformat()
-                ))
-                
-                article_id = cursor.lastrowid
-                logger.info(f"Article saved with ID {article_id}: {article_data['title']}")
-                
-                # Log save event (in same transaction)
-                cursor.execute('''
-                    INSERT INTO reading_stats (article_id, event_type, timestamp, metadata)
-                    VALUES (?, ?, ?, ?)
-                ''', (article_id, 'saved', datetime.now().isoformat(), None))
-                
-                return article_id
+                article_ids = []
+                events = []
+                for article_data in articles:
+                    # Insert unless the URL is already saved (one statement
+                    # either way; the UNIQUE constraint does the check)
+                    cursor.execute(_SQL_INSERT_ARTICLE, (
+                        article_data['url'],
+                        article_data['title'],
+                        article_data['content'],
+                        article_data.get('author'),
+                        article_data.get('published_date'),
+                        article_data.get('description'),
+                        article_data['reading_time'],
+                        article_data['domain'],
+                        article_data['fetched_at'],
+                        saved_at,
+                        saved_at_ts
+                    ))
+                    
+                    if cursor.rowcount == 0:
+                        cursor.execute(_SQL_GET_ARTICLE_ID_BY_URL,
+                                     (article_data['url'],))
+                        logger.info("Article already exists: %s", article_data['url'])
+                        article_ids.append(cursor.fetchone()['id'])
+                        continue
+                    
+                    article_id = cursor.lastrowid
+                    article_ids.append(article_id)
+                    events.append((article_id, 'saved', saved_at, None))
+                    logger.info("Article saved with ID %s: %s", article_id, article_data['title'])
+            
+            # Log save events once the articles are committed
+            for event in events:
+                self._event_queue.put(event)
+            return article_ids
         
         except sqlite3.IntegrityError as e:
-            logger.error(f"Integrity error saving article: {e}")
-            return None
+            logger.error("Integrity error saving articles: %s", e)
+            return [None] * len(articles)
         except Exception as e:
-            logger.error(f"Error saving article: {e}", exc_info=True)
-            return None
+            logger.error("Error saving articles: %s", e, exc_info=True)
+            return [None] * len(articles)
     
+    @_version_cached
     def get_article(self, article_id: int) -> Optional[Dict[str, Any]]:
         """
         Get an article by ID.
@@ -188,15 +857,12 @@ class Storage:
         Returns:
             Article dictionary or None if not found
         """
-        with self._get_connection() as conn:
+        with self._read_ctx() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM articles WHERE id = ?', (article_id,))
-            row = cursor.fetchone()
-            
-            if row:
-                return dict(row)
-            return None
+            cursor.execute(_SQL_GET_ARTICLE, (article_id,))
+            return _fetch_dict(cursor)
     
+    @_version_cached
     def get_article_by_url(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Get an article by URL.
@@ -207,59 +873,97 @@ class Storage:
         Returns:
             Article dictionary or None if not found
         """
-        with self._get_connection() as conn:
+        with self._read_ctx() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM articles WHERE url = ?', (url,))
-            row = cursor.fetchone()
-            
-            if row:
-                return dict(row)
-            return None
+            cursor.execute(_SQL_GET_ARTICLE_BY_URL, (url,))
+            return _fetch_dict(cursor)
     
-    def get_reading_queue(self, limit: int = 50, status: str = 'unread') -> List[Dict[str, Any]]:
+    @_version_cached
+    def get_reading_queue(self, limit: int = 50, status: str = 'unread',
+                          before_saved_at: Optional[str] = None,
+                          before_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Get articles in reading queue.
+        Get articles in reading queue, newest first.
+        
+        For the next page, pass the saved_at and id of the last article of
+        the previous one; each page is an index seek however deep it is.
         
         Args:
             limit: Maximum number of articles to return
             status: Article status filter (default: 'unread')
+            before_saved_at: Only articles saved before this one (with before_id)
+            before_id: ID of the last article of the previous page
             
         Returns:
             List of article dictionaries
         """
-        with self._get_connection() as conn:
+        with self._read_ctx() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM articles 
-                WHERE status = ? 
-                ORDER BY saved_at DESC 
-                LIMIT ?
-            ''', (status, limit))
+            if before_saved_at is not None and before_id is not None:
+                cursor.execute(_SQL_GET_READING_QUEUE_BEFORE,
+                               (status, before_saved_at, before_id, limit))
+            else:
+                cursor.execute(_SQL_GET_READING_QUEUE, (status, limit))
+            
+            return _fetch_dicts(cursor)
+    
+    def get_prioritized_queue(self, limit: int = 10, top_category: Optional[str] = None,
+                              now: Optional[datetime] = None,
+                              candidates: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get unread articles ordered by priority score, computed in SQL.
+        
+        Scores the `candidates` most recently saved unread articles (same
+        rules as Scheduler._calculate_priority_score) and returns the best.
+        Ranking sorts only the scored columns; full rows, content included,
+        are read for the `limit` winners alone. Ties break on newest, then
+        highest id, so a smaller limit always returns a prefix of a larger one.
+        
+        Args:
+            limit: Maximum number of articles to return
+            top_category: User's most common category (scores a bonus)
+            now: Reference time for recency (default: current time)
+            candidates: Number of recent unread articles to consider
             
-            return [dict(row) for row in cursor.fetchall()]
+        Returns:
+            List of article dictionaries, highest priority first
+        """
+        now = now or datetime.now()
+        with self._read_ctx() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SQL_GET_PRIORITIZED_QUEUE,
+                           (int(now.timestamp()), top_category, candidates, limit))
+            
+            return _fetch_dicts(cursor)
     
-    def get_articles_by_category(self, category: str, limit: int = 50) -> List[Dict[str, Any]]:
+    def get_articles_by_category(self, category: str, limit: int = 50,
+                                 before_saved_at: Optional[str] = None,
+                                 before_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Get articles by category.
+        Get articles by category, newest first.
+        
+        Pages like get_reading_queue.
         
         Args:
             category: Category name
             limit: Maximum number of articles to return
+            before_saved_at: Only articles saved before this one (with before_id)
+            before_id: ID of the last article of the previous page
             
         Returns:
             List of article dictionaries
         """
-        with self._get_connection() as conn:
+        with self._read_ctx() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM articles 
-                WHERE category = ? 
-                ORDER BY saved_at DESC 
-                LIMIT ?
-            ''', (category, limit))
+            if before_saved_at is not None and before_id is not None:
+                cursor.execute(_SQL_GET_ARTICLES_BY_CATEGORY_BEFORE,
+                               (category, before_saved_at, before_id, limit))
+            else:
+                cursor.execute(_SQL_GET_ARTICLES_BY_CATEGORY, (category, limit))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
     
+    @_version_cached
     def get_all_categories(self) -> List[Dict[str, Any]]:
         """
         Get all categories with article counts.
@@ -267,16 +971,11 @@ class Storage:
         Returns:
             List of dictionaries with category and count
         """
-        with self._get_connection() as conn:
+        with self._read_ctx() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT category, COUNT(*) as count 
-                FROM articles 
-                GROUP BY category 
-                ORDER BY count DESC
-            ''')
+            cursor.execute(_SQL_GET_ALL_CATEGORIES)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
     
     def mark_as_read(self, article_id: int) -> bool:
         """
@@ -289,22 +988,23 @@ class Storage:
             True if successful, False otherwise
         """
         try:
-            with self._get_connection() as conn:
+            with self._write_ctx() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE articles 
-                    SET status = 'read', read_at = ? 
-                    WHERE id = ?
-                ''', (datetime.now().isoformat(), article_id))
+                read_at = datetime.now().isoformat()
+                cursor.execute(_SQL_MARK_READ, (read_at, article_id))
                 
                 if cursor.rowcount > 0:
-                    logger.info(f"Article {article_id} marked as read")
-                    self._log_event(article_id, 'read')
+                    logger.info("Article %s marked as read", article_id)
+                    self._log_event(article_id, 'read', timestamp=read_at)
                     return True
-                return False
+                
+                # Nothing written: already read (keeps the first read time
+                # and event), or no such article
+                cursor.execute(_SQL_ARTICLE_EXISTS, (article_id,))
+                return cursor.fetchone() is not None
         
         except Exception as e:
-            logger.error(f"Error marking article as read: {e}")
+            logger.error("Error marking article as read: %s", e)
             return False
     
     def update_article_category(self, article_id: int, category: str) -> bool:
@@ -319,21 +1019,20 @@ class Storage:
             True if successful, False otherwise
         """
         try:
-            with self._get_connection() as conn:
+            with self._write_ctx() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE articles 
-                    SET category = ? 
-                    WHERE id = ?
-                ''', (category, article_id))
+                cursor.execute(_SQL_UPDATE_CATEGORY, (category, article_id, category))
                 
                 if cursor.rowcount > 0:
-                    logger.info(f"Article {article_id} category updated to: {category}")
+                    logger.info("Article %s category updated to: %s", article_id, category)
                     return True
-                return False
+                
+                # Nothing written: already in that category, or no such article
+                cursor.execute(_SQL_ARTICLE_EXISTS, (article_id,))
+                return cursor.fetchone() is not None
         
         except Exception as e:
-            logger.error(f"Error updating article category: {e}")
+            logger.error("Error updating article category: %s", e)
             return False
     
     def delete_article(self, article_id: int) -> bool:
@@ -347,19 +1046,20 @@ class Storage:
             True if successful, False otherwise
         """
         try:
-            with self._get_connection() as conn:
+            with self._write_ctx() as conn:
                 cursor = conn.cursor()
-                cursor.execute('DELETE FROM articles WHERE id = ?', (article_id,))
+                cursor.execute(_SQL_DELETE_ARTICLE, (article_id,))
                 
                 if cursor.rowcount > 0:
-                    logger.info(f"Article {article_id} deleted")
+                    logger.info("Article %s deleted", article_id)
                     return True
                 return False
         
         except Exception as e:
-            logger.error(f"Error deleting article: {e}")
+            logger.error("Error deleting article: %s", e)
             return False
     
+    @_version_cached
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get reading statistics.
@@ -367,41 +1067,19 @@ class Storage:
         Returns:
             Dictionary with various statistics
         """
-        with self._get_connection() as conn:
+        with self._read_ctx() as conn:
             cursor = conn.cursor()
             
-            # Total articles
-            cursor.execute('SELECT COUNT(*) as total FROM articles')
-            total = cursor.fetchone()['total']
-            
-            # Articles by status
-            cursor.execute('''
-                SELECT status, COUNT(*) as count 
-                FROM articles 
-                GROUP BY status
-            ''')
-            by_status = {row['status']: row['count'] for row in cursor.fetchall()}
-            
-            # Total reading time
-            cursor.execute('SELECT SUM(reading_time) as total_time FROM articles')
-            total_time = cursor.fetchone()['total_time'] or 0
-            
-            # Read articles reading time
-            cursor.execute('''
-                SELECT SUM(reading_time) as read_time 
-                FROM articles 
-                WHERE status = 'read'
-            ''')
-            read_time = cursor.fetchone()['read_time'] or 0
+            # Running totals kept up to date by triggers on articles
+            cursor.execute(_SQL_GET_COUNTERS)
+            counters = {row['key']: row['value'] for row in cursor.fetchall()}
+            total = counters['total_articles']
+            total_time = counters['total_reading_time']
+            read_time = counters['read_reading_time']
+            by_status = {'unread': counters['unread'], 'read': counters['read']}
             
             # Most common category
-            cursor.execute('''
-                SELECT category, COUNT(*) as count 
-                FROM articles 
-                GROUP BY category 
-                ORDER BY count DESC 
-                LIMIT 1
-            ''')
+            cursor.execute(_SQL_TOP_CATEGORY)
             top_category_row = cursor.fetchone()
             top_category = top_category_row['category'] if top_category_row else None
             
@@ -423,6 +1101,10 @@ class Storage:
         """
         Search articles by title or content.
         
+        Uses the FTS5 index when available: every word must match (with
+        stemming), best matches first. Otherwise, or for a blank query,
+        falls back to a substring scan, newest first.
+        
         Args:
             query: Search query
             limit: Maximum number of results
@@ -430,18 +1112,20 @@ class Storage:
         Returns:
             List of matching article dictionaries
         """
-        with self._get_connection() as conn:
+        # Quote each word so FTS5 query syntax in user input is taken literally
+        terms = ' '.join('"' + word.replace('"', '""') + '"' for word in query.split())
+        
+        with self._read_ctx() as conn:
             cursor = conn.cursor()
-            search_pattern = f'%{query}%'
-            cursor.execute('''
-                SELECT * FROM articles 
-                WHERE title LIKE ? OR content LIKE ? 
-                ORDER BY saved_at DESC 
-                LIMIT ?
-            ''', (search_pattern, search_pattern, limit))
+            if self._has_fts and terms:
+                cursor.execute(_SQL_SEARCH_ARTICLES_FTS, (terms, limit))
+            else:
+                search_pattern = f'%{query}%'
+                cursor.execute(_SQL_SEARCH_ARTICLES, (search_pattern, search_pattern, limit))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
     
+    @_version_cached
     def get_user_preference(self, key: str) -> Optional[str]:
         """
         Get a user preference value.
@@ -452,9 +1136,9 @@ class Storage:
         Returns:
             Preference value or None if not found
         """
-        with self._get_connection() as conn:
+        with self._read_ctx() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT value FROM user_preferences WHERE key = ?', (key,))
+            cursor.execute(_SQL_GET_PREFERENCE, (key,))
             row = cursor.fetchone()
             
             if row:
@@ -473,87 +1157,145 @@ class Storage:
             True if successful, False otherwise
         """
         try:
-            with self._get_connection() as conn:
+            with self._write_ctx() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO user_preferences (key, value, updated_at)
-                    VALUES (?, ?, ?)
-                ''', (key, value, datetime.now().isoformat()))
+                cursor.execute(_SQL_SET_PREFERENCE, (key, value, datetime.now().isoformat()))
                 
-                logger.info(f"User preference set: {key} = {value}")
+                logger.info("User preference set: %s = %s", key, value)
                 return True
         
         except Exception as e:
-            logger.error(f"Error setting user preference: {e}")
+            logger.error("Error setting user preference: %s", e)
             return False
     
-    def _log_event(self, article_id: int, event_type: str, metadata: Optional[str] = None):
+    def _log_event(self, article_id: int, event_type: str, metadata: Optional[str] = None,
+                   timestamp: Optional[str] = None):
         """
         Log a reading event for statistics.
         
+        The event is queued and written by the background event writer;
+        call flush() to wait for it.
+        
         Args:
             article_id: Article ID
             event_type: Type of event (saved, read, etc.)
             metadata: Optional JSON metadata
+            timestamp: ISO event time, when the caller already has it
+                (default: current time)
         """
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO reading_stats (article_id, event_type, timestamp, metadata)
-                    VALUES (?, ?, ?, ?)
-                ''', (article_id, event_type, datetime.now().isoformat(), metadata))
-        
-        except Exception as e:
-            logger.error(f"Error logging event: {e}")
+        self._event_queue.put(
+            (article_id, event_type, timestamp or datetime.now().isoformat(), metadata)
+        )
     
-    def get_recent_activity(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_recent_activity(self, limit: int = 10,
+                            before_timestamp: Optional[str] = None,
+                            before_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Get recent reading activity.
+        Get recent reading activity, newest first.
+        
+        For the next page, pass the timestamp and id of the last event of
+        the previous one.
         
         Args:
             limit: Maximum number of events
+            before_timestamp: Only events before this one (with before_id)
+            before_id: ID of the last event of the previous page
             
         Returns:
             List of activity events
         """
-        with self._get_connection() as conn:
+        self.flush()  # Include events still in the queue
+        with self._read_ctx() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT rs.*, a.title, a.url 
-                FROM reading_stats rs
-                JOIN articles a ON rs.article_id = a.id
-                ORDER BY rs.timestamp DESC
-                LIMIT ?
-            ''', (limit,))
+            if before_timestamp is not None and before_id is not None:
+                cursor.execute(_SQL_GET_RECENT_ACTIVITY_BEFORE,
+                               (before_timestamp, before_id, limit))
+            else:
+                cursor.execute(_SQL_GET_RECENT_ACTIVITY, (limit,))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
+    
+    def get_read_histograms(self, limit: int = 100) -> Dict[str, Any]:
+        """
+        Count read events by hour and weekday among the most recent activity.
+        
+        Histogram keys are ordered by their most recent read, so ties rank
+        the same as counting the events newest-first.
+        
+        Args:
+            limit: Number of most recent events (of any type) to consider
+            
+        Returns:
+            Dictionary with 'hours' (hour -> count), 'weekdays'
+            (0=Monday -> count) and 'total_reads'
+        """
+        self.flush()  # Include events still in the queue
+        with self._read_ctx() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SQL_READ_HISTOGRAMS, (limit,))
+            
+            hours = {}
+            weekdays = {}
+            total_reads = 0
+            for row in cursor.fetchall():
+                total_reads += row['count']
+                if row['hour'] is None:  # Unparseable timestamp
+                    continue
+                hours[row['hour']] = hours.get(row['hour'], 0) + row['count']
+                weekday = (row['weekday'] + 6) % 7  # SQLite %w: 0=Sunday
+                weekdays[weekday] = weekdays.get(weekday, 0) + row['count']
+            
+            return {'hours': hours, 'weekdays': weekdays, 'total_reads': total_reads}
+    
+    def get_top_read_hours(self, top: int = 5, limit: int = 100) -> List[int]:
+        """
+        Get the hours of day with the most read events among recent activity.
+        
+        Uses the same window and tie order as get_read_histograms.
+        
+        Args:
+            top: Maximum number of hours to return
+            limit: Number of most recent events (of any type) to consider
+            
+        Returns:
+            List of hours (0-23), most frequent first
+        """
+        self.flush()  # Include events still in the queue
+        with self._read_ctx() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SQL_TOP_READ_HOURS, (limit, top))
+            
+            return [row['hour'] for row in cursor.fetchall()]
     
     def cleanup_old_articles(self, days: int = 90) -> int:
         """
         Delete read articles older than specified days.
         
+        Deletes CLEANUP_BATCH_SIZE articles per transaction, so other writes
+        can run between batches. If a batch fails, earlier batches stay
+        deleted.
+        
         Args:
             days: Number of days to keep
             
         Returns:
             Number of articles deleted
         """
+        cutoff_iso = (datetime.now() - timedelta(days=days)).isoformat()
+        deleted_count = 0
+        
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cutoff_date = datetime.now().timestamp() - (days * 24 * 60 * 60)
-                cutoff_iso = datetime.fromtimestamp(cutoff_date).isoformat()
-                
-                cursor.execute('''
-                    DELETE FROM articles 
-                    WHERE status = 'read' AND read_at < ?
-                ''', (cutoff_iso,))
-                
-                deleted_count = cursor.rowcount
-                logger.info(f"Cleaned up {deleted_count} old articles")
-                return deleted_count
+            while True:
+                with self._write_ctx() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(_SQL_DELETE_OLD_READ_ARTICLES,
+                                   (cutoff_iso, self.CLEANUP_BATCH_SIZE))
+                    if not cursor.rowcount:
+                        break
+                    deleted_count += cursor.rowcount
         
         except Exception as e:
-            logger.error(f"Error cleaning up old articles: {e}")
-            return 0
\ No newline at end of file
+            logger.error("Error cleaning up old articles: %s", e)
+        
+        logger.info("Cleaned up %s old articles", deleted_count)
+        return deleted_count
\ No newline at end of file
@@ -2,13 +2,52 @@
 Telex Communication Layer - handles all API interactions with Telex platform.
 """
 import requests
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any
 from config.config import Config
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Upper bound on concurrent requests in send_messages (matches the pool size)
+MAX_SEND_WORKERS = 20
+
+# Retries for failed Telex calls: connection errors on any method, and
+# throttled/unavailable responses on idempotent methods only, so a POST
+# that the server may have processed is never sent twice
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=['GET', 'PUT'],
+    raise_on_status=False
+)
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body with orjson.
+    
+    Args:
+        response: Response from the Telex API
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        requests.exceptions.InvalidJSONError: If the body is not valid JSON
+            (a RequestException, like response.json()'s error)
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(
+            f"Invalid JSON in response: {e}", response=response
+        ) from e
+
 
 class TelexCommunicator:
     """Handles all communication with Telex platform."""
@@ -23,6 +62,17 @@ class TelexCommunicator:
             "X-AGENT-API-KEY": self.api_key,
             "Content-Type": "application/json"
         }
+        
+        # Endpoints depend only on config, so build them once
+        self._messages_url = f"{self.base_url}/channels/{self.channel_id}/messages"
+        self._webhooks_url = f"{self.base_url}/webhooks/{self.channel_id}"
+        
+        # One session keeps HTTPS connections to Telex alive between calls
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRY)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
         logger.info("TelexCommunicator initialized")
     
     def send_message(self, content: str, thread_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -36,31 +86,51 @@ class TelexCommunicator:
         Returns:
             Response from Telex API or None on failure
         """
-        endpoint = f"{self.base_url}/channels/{self.channel_id}/messages"
-        payload = {"content": content}
-        
         if thread_id:
-            payload["thread_id"] = thread_id
+            payload = {"content": content, "thread_id": thread_id}
+        else:
+            payload = {"content": content}
         
         try:
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=payload,
+            response = self._session.post(
+                self._messages_url,
+                data=orjson.dumps(payload),
                 timeout=10
             )
             response.raise_for_status()
             logger.info("Message sent to channel successfully")
-            return response.json()
+            return _parse_json(response)
         
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error sending message: {e}")
+            logger.error("HTTP error sending message: %s", e)
             self._handle_http_error(e)
             return None
         except requests.exceptions.RequestException as e:
-            logger.error(f"Network error sending message: {e}")
+            logger.error("Network error sending message: %s", e)
             return None
     
+    def send_messages(self, contents: list[str],
+                      thread_id: Optional[str] = None) -> list[Optional[Dict[str, Any]]]:
+        """
+        Send several messages to the configured Telex channel concurrently.
+        
+        Requests overlap on the shared session's connection pool, so N
+        messages take about as long as the slowest one rather than the sum.
+        Delivery order between the messages is not guaranteed.
+        
+        Args:
+            contents: Message contents to send
+            thread_id: Optional thread ID if replying in a thread
+            
+        Returns:
+            Response from Telex API (or None on failure) for each message, in order
+        """
+        if not contents:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_SEND_WORKERS, len(contents))) as executor:
+            return list(executor.map(lambda content: self.send_message(content, thread_id), contents))
+    
     def send_formatted_reading_list(self, items: list[Dict[str, str]], 
                                    title: str = "📚 Your Reading List") -> Optional[Dict[str, Any]]:
         """
@@ -77,13 +147,11 @@ class TelexCommunicator:
             logger.warning("Attempted to send empty reading list")
             return None
         
-        message = f"{title}\n\n"
+        parts = [f"{title}\n\n"]
         for i, item in enumerate(items, 1):
-            item_title = item.get('title', 'Untitled')
-            item_url = item.get('url', '')
-            message += f"{i}. {item_title}\n   {item_url}\n\n"
+            parts.append(f"{i}. {item.get('title', 'Untitled')}\n   {item.get('url', '')}\n\n")
         
-        return self.send_message(message)
+        return self.send_message("".join(parts))
     
     def get_messages(self, limit: int = 50) -> Optional[Dict[str, Any]]:
         """
@@ -95,19 +163,16 @@ class TelexCommunicator:
         Returns:
             List of messages or None on failure
         """
-        endpoint = f"{self.base_url}/channels/{self.channel_id}/messages"
-        
         try:
-            response = requests.get(
-                endpoint,
-                headers=self.headers,
+            response = self._session.get(
+                self._messages_url,
                 timeout=10
             )
             response.raise_for_status()
-            return response.json()
+            return _parse_json(response)
         
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error retrieving messages: {e}")
+            logger.error("Error retrieving messages: %s", e)
             return None
     
     def create_webhook(self, webhook_name: str, webhook_url: str,
@@ -123,7 +188,6 @@ class TelexCommunicator:
         Returns:
             Created webhook data including webhook_slug or None on failure
         """
-        endpoint = f"{self.base_url}/webhooks/{self.channel_id}"
         payload = {
             "webhook_name": webhook_name,
             "event_name": event_name,
@@ -131,21 +195,20 @@ class TelexCommunicator:
         }
         
         try:
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=payload,
+            response = self._session.post(
+                self._webhooks_url,
+                data=orjson.dumps(payload),
                 timeout=10
             )
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json(response)
             
             webhook_slug = data.get('data', {}).get('webhook_slug')
-            logger.info(f"Webhook created successfully: {webhook_slug}")
+            logger.info("Webhook created successfully: %s", webhook_slug)
             return data
         
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error creating webhook: {e}")
+            logger.error("Error creating webhook: %s", e)
             return None
     
     def get_webhook(self) -> Optional[Dict[str, Any]]:
@@ -155,19 +218,16 @@ class TelexCommunicator:
         Returns:
             Webhook data or None on failure
         """
-        endpoint = f"{self.base_url}/webhooks/{self.channel_id}"
-        
         try:
-            response = requests.get(
-                endpoint,
-                headers=self.headers,
+            response = self._session.get(
+                self._webhooks_url,
                 timeout=10
             )
             response.raise_for_status()
-            return response.json()
+            return _parse_json(response)
         
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error retrieving webhook: {e}")
+            logger.error("Error retrieving webhook: %s", e)
             return None
     
     def update_webhook_status(self, webhook_id: str, 
@@ -182,22 +242,21 @@ class TelexCommunicator:
         Returns:
             Updated webhook data or None on failure
         """
-        endpoint = f"{self.base_url}/webhooks/{self.channel_id}/{webhook_id}/change-status"
+        endpoint = f"{self._webhooks_url}/{webhook_id}/change-status"
         payload = {"webhook_status": status}
         
         try:
-            response = requests.put(
+            response = self._session.put(
                 endpoint,
-                headers=self.headers,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=10
             )
             response.raise_for_status()
-            logger.info(f"Webhook status updated to: {status}")
-            return response.json()
+            logger.info("Webhook status updated to: %s", status)
+            return _parse_json(response)
         
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error updating webhook status: {e}")
+            logger.error("Error updating webhook status: %s", e)
             return None
     
     def _handle_http_error(self, error: requests.exceptions.HTTPError) -> None:
@@ -220,4 +279,4 @@ class TelexCommunicator:
         elif status_code == 429:
             logger.warning("Rate limit exceeded - implement backoff")
         else:
-            logger.error(f"HTTP {status_code} error occurred")
\ No newline at end of file
+            logger.error("HTTP %s error occurred", status_code)
\ No newline at end of file
@@ -1,28 +1,218 @@
 """
 Webhook Receiver - Flask server to receive webhook events from Telex.
 """
-from flask import Flask, request, jsonify
-from typing import Callable, Dict, Any
+from flask import Flask, Response, g, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
+from typing import Callable, Dict, Any, Optional, Union
+import queue
+import re
+import threading
+from collections import OrderedDict
+import orjson
+from config.config import Config
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Routes request.get_json() and jsonify() through orjson instead of the
+    stdlib json module. Types orjson cannot serialize natively fall back to
+    Flask's default conversions.
+    """
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string (formatting options are ignored)."""
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or bytes."""
+        return orjson.loads(s)
+
+
+# Top-level "event_name" string in a raw webhook body (the first occurrence)
+_EVENT_NAME_RE = re.compile(rb'"event_name"\s*:\s*"([^"\\]*)"')
+
+
+def _peek_event_name(raw: bytes) -> str:
+    """
+    Pull event_name out of a raw webhook body without decoding the rest.
+    
+    Args:
+        raw: Request body bytes
+        
+    Returns:
+        Event name, or 'unknown' if the body has none
+    """
+    match = _EVENT_NAME_RE.search(raw)
+    return match.group(1).decode('utf-8', 'replace') if match else 'unknown'
+
+
+# Bodies of the fixed responses, serialized once at import
+_QUEUED_BODY = orjson.dumps({
+    "status": "queued",
+    "message": "Webhook received and queued for processing"
+})
+_EMPTY_BODY = orjson.dumps({"error": "Empty payload"})
+_INVALID_BODY = orjson.dumps({"error": "Invalid JSON"})
+_TOO_LARGE_BODY = orjson.dumps({"error": "Payload too large"})
+_UNSUPPORTED_BODY = orjson.dumps({"error": "Unsupported media type"})
+_DUPLICATE_BODY = orjson.dumps({
+    "status": "duplicate",
+    "message": "Webhook already received"
+})
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Smart Read Later Organizer"
+})
+_ROOT_BODY = orjson.dumps({
+    "service": "Smart Read Later Organizer",
+    "version": "1.0.0",
+    "endpoints": {
+        "webhook": "/webhook (POST)",
+        "health": "/health (GET)"
+    }
+})
+
+
+def _static_response(body: bytes, status: int = 200,
+                     headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Wrap a pre-serialized JSON body in a new response.
+    
+    Args:
+        body: JSON bytes
+        status: HTTP status code
+        headers: Extra response headers
+        
+    Returns:
+        Flask Response with application/json mimetype
+    """
+    return Response(body, status=status, mimetype='application/json', headers=headers)
+
+
 class WebhookReceiver:
     """Flask server to receive and process webhook events from Telex."""
     
-    def __init__(self, callback: Callable[[Dict[str, Any]], None]):
+    # Message ids remembered for dropping redeliveries (least recently seen go first)
+    SEEN_CACHE_SIZE = 10000
+    
+    def __init__(self, callback: Callable[[Any], None], raw: bool = False,
+                 workers: Optional[int] = None):
         """
         Initialize webhook receiver.
         
+        The body is read and decoded exactly once per request and is not
+        kept by Flask, so the callback must use the payload it is given.
+        Other code in the same request can reuse it as g.webhook_payload.
+        
+        Accepted webhooks are queued and answered with 202 at once;
+        background threads run the callback on each payload, outside any
+        request context. With one worker, payloads are processed in arrival
+        order; more workers let I/O-bound callbacks (article fetches, database
+        writes) overlap, but then the callback must be thread-safe and
+        ordering is not kept.
+        
         Args:
             callback: Function to call when webhook is triggered with event data
+            raw: Pass the callback the undecoded body bytes instead of the
+                parsed payload dict, for callbacks that parse or forward the
+                body themselves (the body is then never decoded here)
+            workers: Number of callback threads (default: Config.WEBHOOK_WORKERS)
         """
         self.app = Flask(__name__)
+        self.app.json = OrjsonProvider(self.app)
+        # Bodies over the limit are refused before they are read
+        self.app.config['MAX_CONTENT_LENGTH'] = Config.MAX_WEBHOOK_BYTES
         self.callback = callback
+        self.raw = raw
+        
+        self._seen = OrderedDict()  # message id -> None, oldest first
+        self._seen_lock = threading.Lock()
+        self._errors_seen: Dict[type, int] = {}  # exception type -> occurrences
+        self._errors_lock = threading.Lock()
+        
+        self._queue = queue.Queue()
+        self._workers = [
+            threading.Thread(target=self._worker, name=f'webhook-worker-{i}', daemon=True)
+            for i in range(max(1, workers or Config.WEBHOOK_WORKERS))
+        ]
+        for worker in self._workers:
+            worker.start()
+        
         self._setup_routes()
         logger.info("WebhookReceiver initialized")
     
+    def _worker(self):
+        """Run the callback on queued payloads, one at a time, until the process exits."""
+        while True:
+            payload = self._queue.get()
+            try:
+                self.callback(payload)
+            except Exception as e:
+                self._log_error("Error processing webhook", e)
+            finally:
+                self._queue.task_done()
+    
+    def flush(self):
+        """Block until every queued webhook has been processed."""
+        self._queue.join()
+    
+    def _log_error(self, message: str, error: Exception):
+        """
+        Log an error, with a traceback for only a sample of repeats.
+        
+        The 1st, 2nd, 4th, 8th, ... and every 1000th occurrence of each
+        exception type are logged with their traceback; the rest as a
+        one-line warning, so a failure storm does not format thousands of
+        identical tracebacks.
+        
+        Args:
+            message: What was being done when the error occurred
+            error: The exception
+        """
+        with self._errors_lock:
+            count = self._errors_seen.get(type(error), 0) + 1
+            self._errors_seen[type(error)] = count
+        
+        if count & (count - 1) == 0 or count % 1000 == 0:
+            logger.error("%s: %s (occurrence %s)", message, error, count, exc_info=error)
+        else:
+            logger.warning("%s: %s: %s", message, type(error).__name__, error)
+    
+    def _first_delivery(self, event: Any) -> bool:
+        """
+        Record an event's message id and report whether it is new.
+        
+        Telex may deliver the same message more than once (retries); only
+        the first delivery should reach the callback.
+        
+        Args:
+            event: Decoded webhook event
+            
+        Returns:
+            False if the message id was seen recently, True otherwise
+            (including events without a usable message id)
+        """
+        message = event.get('message') if isinstance(event, dict) else None
+        message_id = message.get('id') if isinstance(message, dict) else None
+        if not isinstance(message_id, (str, int)):
+            return True
+        
+        with self._seen_lock:
+            if message_id in self._seen:
+                self._seen.move_to_end(message_id)
+                return False
+            
+            self._seen[message_id] = None
+            if len(self._seen) > self.SEEN_CACHE_SIZE:
+                self._seen.popitem(last=False)
+            return True
+    
     def _setup_routes(self):
         """Set up Flask routes for webhook endpoints."""
         
@@ -31,6 +221,9 @@ class WebhookReceiver:
             """
             Handle incoming webhook POST from Telex.
             
+            The body is a single event, or a JSON array of events that are
+            each passed to the callback separately.
+            
             Expected payload structure (update based on actual Telex webhook):
             {
                 "event_name": "message.received",
@@ -46,27 +239,65 @@ class WebhookReceiver:
                 }
             }
             """
+            # Anything but JSON is turned away before the body is touched
+            if not (request.is_json or request.mimetype == 'text/json'):
+                logger.warning("Rejected webhook with content type %r", request.mimetype)
+                return _static_response(_UNSUPPORTED_BODY, 415)
+            
+            # Declared size is checked before any of the body is read
+            if (request.content_length or 0) > Config.MAX_WEBHOOK_BYTES:
+                logger.warning("Rejected %s byte webhook payload", request.content_length)
+                return _static_response(_TOO_LARGE_BODY, 413)
+            
             try:
-                data = request.get_json()
+                raw = request.get_data(cache=False)
                 
-                if not data:
+                # isspace() tests in place; strip() would copy the whole body
+                if not raw or raw.isspace():
                     logger.warning("Received empty webhook payload")
-                    return jsonify({"error": "Empty payload"}), 400
+                    return _static_response(_EMPTY_BODY, 400)
                 
-                event_name = data.get('event_name', 'unknown')
-                logger.info(f"Received webhook event: {event_name}")
-                logger.debug(f"Webhook payload: {data}")
+                # Logged from the raw bytes, so raw mode never decodes the body
+                event_name = _peek_event_name(raw)
+                logger.info("Received webhook event: %s", event_name)
                 
-                # Call the callback to process the webhook data
-                self.callback(data)
+                if self.raw:
+                    self._queue.put(raw)
+                else:
+                    # Decoded directly, without get_json()'s content-type
+                    # and charset handling
+                    try:
+                        data = g.webhook_payload = orjson.loads(raw)
+                    except orjson.JSONDecodeError as e:
+                        logger.warning("Received invalid webhook JSON: %s", e)
+                        return _static_response(_INVALID_BODY, 400)
+                    
+                    if not data:
+                        logger.warning("Received empty webhook payload")
+                        return _static_response(_EMPTY_BODY, 400)
+                    
+                    logger.debug("Webhook payload: %s", data)
+                    
+                    # The worker threads call the callback with the data; a
+                    # batch (JSON array of events) is queued event by event
+                    events = data if isinstance(data, list) else [data]
+                    new_events = [event for event in events if self._first_delivery(event)]
+                    if not new_events:
+                        logger.info("Skipped duplicate webhook delivery")
+                        return _static_response(_DUPLICATE_BODY, 200)
+                    
+                    for event in new_events:
+                        self._queue.put(event)
                 
-                return jsonify({
-                    "status": "success",
-                    "message": "Webhook received and processed"
-                }), 200
+                return _static_response(_QUEUED_BODY, 202)
+            
+            except RequestEntityTooLarge:
+                # Streamed (chunked) body that ran past MAX_CONTENT_LENGTH
+                logger.warning("Rejected oversized webhook payload")
+                return _static_response(_TOO_LARGE_BODY, 413)
             
             except Exception as e:
-                logger.error(f"Error processing webhook: {e}", exc_info=True)
+                self._log_error("Error processing webhook", e)
                 return jsonify({
                     "status": "error",
                     "message": str(e)
@@ -75,38 +306,43 @@ class WebhookReceiver:
         @self.app.route('/health', methods=['GET'])
         def health_check():
             """Health check endpoint to verify server is running."""
-            return jsonify({
-                "status": "healthy",
-                "service": "Smart Read Later Organizer"
-            }), 200
+            return _static_response(_HEALTH_BODY, headers={'Cache-Control': 'no-cache'})
         
         @self.app.route('/', methods=['GET'])
         def root():
             """Root endpoint with basic info."""
-            return jsonify({
-                "service": "Smart Read Later Organizer",
-                "version": "1.0.0",
-                "endpoints": {
-                    "webhook": "/webhook (POST)",
-                    "health": "/health (GET)"
-                }
-            }), 200
+            return _static_response(_ROOT_BODY)
     
-    def run(self, host: str = '0.0.0.0', port: int = 5000, debug: bool = False):
+    def run(self, host: str = '0.0.0.0', port: int = 5000, debug: bool = False,
+            server_type: str = 'waitress', threads: int = 8):
         """
-        Start the Flask webhook server.
+        Start the webhook server.
         
         Args:
             host: Host to bind to (default: 0.0.0.0 for all interfaces)
             port: Port to listen on (default: 5000)
             debug: Enable Flask debug mode (default: False for production)
+            server_type: 'waitress' for the multi-threaded production server,
+                'flask' for the development server
+            threads: Worker threads when running under Waitress
         """
-        logger.info(f"Starting webhook server on {host}:{port}")
-        logger.info(f"Webhook endpoint: http://{host}:{port}/webhook")
+        logger.info("Starting webhook server on %s:%s", host, port)
+        logger.info("Webhook endpoint: http://%s:%s/webhook", host, port)
+        
+        if server_type == 'waitress' and not debug:
+            try:
+                from waitress import serve
+            except ImportError:
+                logger.warning("waitress not installed, falling back to Flask dev server")
+            else:
+                logger.info("Serving with Waitress (%s threads)", threads)
+                serve(self.app, host=host, port=port, threads=threads)
+                return
         
         self.app.run(
             host=host,
             port=port,
             debug=debug,
+            threaded=True,
             use_reloader=False  # Avoid double initialization
         )
\ No newline at end of file
@@ -3,6 +3,7 @@ Test script for Content Ingestion module.
 Run this to verify URL fetching works correctly.
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -28,12 +29,15 @@ def test_basic_fetch():
     
     print("\n🧪 Testing URL fetching...\n")
     
-    for url in test_urls:
-        print(f"\n📎 Fetching: {url}")
+    # Fetch all pages at once (network-bound, so the waits overlap), then
+    # report them in order
+    with ThreadPoolExecutor(max_workers=len(test_urls)) as executor:
+        articles = list(executor.map(ingester.fetch_article, test_urls))
+    
+    for url, article in zip(test_urls, articles):
+        print(f"\n📎 Fetched: {url}")
         print("-" * 60)
         
-        article = ingester.fetch_article(url)
-        
         if article:
             print(f"✅ Success!")
             print(f"   Title: {article.title}")
@@ -91,9 +95,11 @@ def test_invalid_urls():
         "https://httpstat.us/500",  # Returns 500
     ]
     
-    for url in invalid_urls:
+    with ThreadPoolExecutor(max_workers=len(invalid_urls)) as executor:
+        articles = list(executor.map(ingester.fetch_article, invalid_urls))
+    
+    for url, article in zip(invalid_urls, articles):
         print(f"Testing: {url}")
-        article = ingester.fetch_article(url)
         
         if article:
             print(f"  ⚠️ Unexpectedly succeeded")
@@ -1,267 +1,217 @@
 """
-This is a test script foR Storage module.
-Would make sure db operations work correctly.
+Tests for the Storage module - make sure database operations work correctly.
+
+    python -m pytest tests/test_storage.py
+
+All tests share one database, opened once per module; tests that change
+an article save one of their own, so they do not depend on running order.
 """
-import sys 
+import sys
+import threading
 from pathlib import Path
-import os 
+from datetime import datetime
+
+import pytest
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from modules.storage import Storage
-from datetime import datetime
 
 
-def cleanup_test_db():
-    """Remove test database if it exists."""
-    test_db = "test_read_later.db"
-    if os.path.exists(test_db):
-        os.remove(test_db)
-        print(f"Cleaned up old test database")
+# One timestamp for every test article
+FETCHED_AT = datetime.now().isoformat()
+
+ARTICLE_1 = {
+    'url': 'https://example.com/article1',
+    'title': 'Test Article 1',
+    'content': 'This is test content for article 1. ' * 50,
+    'author': 'John Doe',
+    'published_date': '2024-01-15',
+    'description': 'Test description',
+    'reading_time': 5,
+    'domain': 'example.com',
+    'fetched_at': FETCHED_AT
+}
+
+ARTICLE_2 = {
+    'url': 'https://example.com/article2',
+    'title': 'Test Article 2',
+    'content': 'This is test content for article 2. ' * 30,
+    'author': 'Jane Smith',
+    'published_date': None,
+    'description': None,
+    'reading_time': 3,
+    'domain': 'example.com',
+    'fetched_at': FETCHED_AT
+}
+
+
+def make_article(slug: str):
+    """A minimal article for a test that modifies it."""
+    return {
+        'url': f'https://example.com/{slug}',
+        'title': f'Scratch Article {slug}',
+        'content': 'Scratch content. ' * 20,
+        'reading_time': 2,
+        'domain': 'example.com',
+        'fetched_at': FETCHED_AT
+    }
 
 
-def test_database_initialization():
-    """Test database creation and schema."""
-    print("=" * 60)
-    print("Testing Database Initialization")
-    print("=" * 60)
-    
-    storage = Storage(db_path="test_read_later.db")
-    print("✅ Database initialized successfully")
-    return storage
+@pytest.fixture(scope="module")
+def storage(tmp_path_factory):
+    """Storage on a fresh database, shared by every test in the module."""
+    db = tmp_path_factory.mktemp("storage") / "test_read_later.db"
+    storage = Storage(db_path=str(db), fast=True)
+    yield storage
+    storage.close()
 
 
-def test_save_article(storage):
-    """Test saving articles."""
-    print("\n" + "=" * 60)
-    print("Testing Article Saving")
-    print("=" * 60)
-    
-    # Test article 1
-    article1 = {
-        'url': 'https://example.com/article1',
-        'title': 'Test Article 1',
-        'content': 'This is test content for article 1. ' * 50,
-        'author': 'John Doe',
-        'published_date': '2024-01-15',
-        'description': 'Test description',
-        'reading_time': 5,
-        'domain': 'example.com',
-        'fetched_at': datetime.now().isoformat()
-    }
-    
-    article_id = storage.save_article(article1)
-    print(f"✅ Article 1 saved with ID: {article_id}")
-    
-    # Test article 2
-    article2 = {
-        'url': 'https://example.com/article2',
-        'title': 'Test Article 2',
-        'content': 'This is test content for article 2. ' * 30,
-        'author': 'Jane Smith',
-        'published_date': None,
-        'description': None,
-        'reading_time': 3,
-        'domain': 'example.com',
-        'fetched_at': datetime.now().isoformat()
-    }
-    
-    article_id2 = storage.save_article(article2)
-    print(f"✅ Article 2 saved with ID: {article_id2}")
-    
-    # Test duplicate (should return existing ID)
-    duplicate_id = storage.save_article(article1)
-    print(f"✅ Duplicate handling works (ID: {duplicate_id})")
+@pytest.fixture(scope="module")
+def article_ids(storage):
+    """IDs of ARTICLE_1 and ARTICLE_2, saved in one transaction."""
+    return storage.save_articles([ARTICLE_1, ARTICLE_2])
+
+
+def test_database_initialization(storage):
+    stats = storage.get_statistics()
+    assert stats['total_articles'] >= 0
+
+
+def test_save_article(storage, article_ids):
+    article_id, article_id2 = article_ids
+    assert article_id is not None
+    assert article_id2 is not None
+    assert article_id != article_id2
     
-    return article_id, article_id2
+    # Duplicate URL returns the existing ID
+    assert storage.save_article(ARTICLE_1) == article_id
 
 
-def test_get_article(storage, article_id):
-    """Test retrieving articles."""
-    print("\n" + "=" * 60)
-    print("Testing Article Retrieval")
-    print("=" * 60)
+def test_get_article(storage, article_ids):
+    article = storage.get_article(article_ids[0])
+    assert article is not None
+    assert article['title'] == 'Test Article 1'
+    assert article['url'] == 'https://example.com/article1'
+    assert article['reading_time'] == 5
     
-    article = storage.get_article(article_id)
-    if article:
-        print(f"✅ Retrieved article: {article['title']}")
-        print(f"   URL: {article['url']}")
-        print(f"   Reading time: {article['reading_time']} min")
-        print(f"   Status: {article['status']}")
-    else:
-        print(f"❌ Failed to retrieve article")
+    by_url = storage.get_article_by_url('https://example.com/article1')
+    assert by_url is not None
+    assert by_url['id'] == article_ids[0]
+
+
+def test_get_missing_article(storage):
+    assert storage.get_article(999999) is None
+
+
+def test_reading_queue(storage, article_ids):
+    queue_ids = {article['id'] for article in storage.get_reading_queue()}
+    assert set(article_ids) <= queue_ids
+
+
+def test_categories(storage, article_ids):
+    article_id = article_ids[0]
+    storage.update_article_category(article_id, 'Technology')
     
-    # Test get by URL
-    article2 = storage.get_article_by_url('https://example.com/article1')
-    if article2:
-        print(f"✅ Retrieved article by URL: {article2['title']}")
+    categories = {cat['category']: cat['count'] for cat in storage.get_all_categories()}
+    assert categories.get('Technology', 0) >= 1
     
-    return article
+    tech_ids = [article['id'] for article in storage.get_articles_by_category('Technology')]
+    assert article_id in tech_ids
 
 
-def test_reading_queue(storage):
-    """Test reading queue functionality."""
-    print("\n" + "=" * 60)
-    print("Testing Reading Queue")
-    print("=" * 60)
+def test_mark_as_read(storage):
+    [article_id] = storage.save_articles([make_article('read-me')])
     
-    queue = storage.get_reading_queue()
-    print(f"✅ Reading queue has {len(queue)} articles")
+    assert storage.mark_as_read(article_id)
     
-    for i, article in enumerate(queue, 1):
-        print(f"   {i}. {article['title']} ({article['reading_time']} min)")
+    article = storage.get_article(article_id)
+    assert article['status'] == 'read'
+    assert article['read_at'] is not None
 
 
-def test_categories(storage, article_id):
-    """Test category functionality."""
-    print("\n" + "=" * 60)
-    print("Testing Categories")
-    print("=" * 60)
+def test_read_after_concurrent_write(storage):
+    [article_id] = storage.save_articles([make_article('concurrent')])
+    in_transaction = threading.Event()
+    release = threading.Event()
     
-    # Update category
-    success = storage.update_article_category(article_id, 'Technology')
-    if success:
-        print(f"✅ Category updated for article {article_id}")
+    def write():
+        # Hold the transaction open after the update, before COMMIT
+        with storage._write_ctx():
+            storage.update_article_category(article_id, 'Concurrent')
+            in_transaction.set()
+            release.wait(5)
     
-    # Get categories
-    categories = storage.get_all_categories()
-    print(f"✅ Found {len(categories)} categories:")
-    for cat in categories:
-        print(f"   • {cat['category']}: {cat['count']} articles")
+    writer = threading.Thread(target=write)
+    writer.start()
+    assert in_transaction.wait(5)
     
-    # Get articles by category
-    tech_articles = storage.get_articles_by_category('Technology')
-    print(f"✅ Found {len(tech_articles)} articles in Technology category")
-
-
-def test_mark_as_read(storage, article_id):
-    """Test marking articles as read."""
-    print("\n" + "=" * 60)
-    print("Testing Mark as Read")
-    print("=" * 60)
+    # Reads in the window see (and may cache) the last committed state
+    assert storage.get_article(article_id)['category'] == 'Uncategorized'
+    categories = {cat['category'] for cat in storage.get_all_categories()}
+    assert 'Concurrent' not in categories
     
-    success = storage.mark_as_read(article_id)
-    if success:
-        print(f"✅ Article {article_id} marked as read")
-        
-        # Verify status changed
-        article = storage.get_article(article_id)
-        print(f"   Status: {article['status']}")
-        print(f"   Read at: {article['read_at']}")
-
-
-def test_statistics(storage):
-    """Test statistics functionality."""
-    print("\n" + "=" * 60)
-    print("Testing Statistics")
-    print("=" * 60)
+    release.set()
+    writer.join(5)
     
+    # Once committed, cached results from the window must not be served
+    assert storage.get_article(article_id)['category'] == 'Concurrent'
+    categories = {cat['category'] for cat in storage.get_all_categories()}
+    assert 'Concurrent' in categories
+
+
+def test_statistics(storage, article_ids):
     stats = storage.get_statistics()
-    print(f"✅ Statistics retrieved:")
-    print(f"   Total articles: {stats['total_articles']}")
-    print(f"   Unread: {stats['unread']}")
-    print(f"   Read: {stats['read']}")
-    print(f"   Read percentage: {stats['read_percentage']}%")
-    print(f"   Total reading time: {stats['total_reading_time']} min")
-    print(f"   Average reading time: {stats['average_reading_time']} min")
-    print(f"   Top category: {stats['top_category']}")
-
-
-def test_search(storage):
-    """Test search functionality."""
-    print("\n" + "=" * 60)
-    print("Testing Search")
-    print("=" * 60)
+    for key in ('total_articles', 'unread', 'read', 'read_percentage',
+                'total_reading_time', 'average_reading_time', 'top_category'):
+        assert key in stats
+    
+    assert stats['total_articles'] >= len(article_ids)
+    assert stats['unread'] + stats['read'] == stats['total_articles']
+    assert 0 <= stats['read_percentage'] <= 100
+
+
+def test_search(storage, article_ids):
+    result_ids = {article['id'] for article in storage.search_articles('Test')}
+    assert set(article_ids) <= result_ids
+
+
+def test_search_full_text(storage, article_ids):
+    if not storage._has_fts:
+        pytest.skip("SQLite built without FTS5")
     
-    results = storage.search_articles('Test')
-    print(f"✅ Search for 'Test' found {len(results)} articles")
+    # Words are stemmed, so "articles" finds "Article"
+    result_ids = {article['id'] for article in storage.search_articles('articles')}
+    assert set(article_ids) <= result_ids
     
-    for article in results:
-        print(f"   • {article['title']}")
+    # FTS5 query syntax in the input is matched literally, not parsed
+    assert storage.search_articles('Test "OR* NEAR(') == []
 
 
 def test_user_preferences(storage):
-    """Test user preferences."""
-    print("\n" + "=" * 60)
-    print("Testing User Preferences")
-    print("=" * 60)
-    
-    # Set preference
     storage.set_user_preference('theme', 'dark')
-    print(f"✅ User preference set: theme = dark")
-    
-    # Get preference
-    theme = storage.get_user_preference('theme')
-    print(f"✅ User preference retrieved: theme = {theme}")
+    assert storage.get_user_preference('theme') == 'dark'
     
-    # Get non-existent preference
-    missing = storage.get_user_preference('nonexistent')
-    print(f"✅ Non-existent preference returns: {missing}")
+    # Non-existent preference
+    assert storage.get_user_preference('nonexistent') is None
 
 
-def test_recent_activity(storage):
-    """Test recent activity tracking."""
-    print("\n" + "=" * 60)
-    print("Testing Recent Activity")
-    print("=" * 60)
-    
+def test_recent_activity(storage, article_ids):
     activity = storage.get_recent_activity(limit=5)
-    print(f"✅ Recent activity has {len(activity)} events:")
+    assert 0 < len(activity) <= 5
     
     for event in activity:
-        print(f"   • {event['event_type']}: {event['title']}")
-        print(f"     At: {event['timestamp']}")
+        assert event['event_type']
+        assert event['timestamp']
 
 
-def test_delete_article(storage, article_id):
-    """Test deleting articles."""
-    print("\n" + "=" * 60)
-    print("Testing Article Deletion")
-    print("=" * 60)
+def test_delete_article(storage):
+    [article_id] = storage.save_articles([make_article('delete-me')])
     
-    success = storage.delete_article(article_id)
-    if success:
-        print(f"✅ Article {article_id} deleted successfully")
-        
-        # Verify deletion
-        article = storage.get_article(article_id)
-        if article is None:
-            print(f"✅ Article confirmed deleted")
-        else:
-            print(f"⚠️ Article still exists after deletion")
+    assert storage.delete_article(article_id)
+    assert storage.get_article(article_id) is None
 
 
 if __name__ == "__main__":
-    try:
-        # Clean up any previous test database
-        cleanup_test_db()
-        
-        # Run tests
-        storage = test_database_initialization()
-        article_id, article_id2 = test_save_article(storage)
-        test_get_article(storage, article_id)
-        test_reading_queue(storage)
-        test_categories(storage, article_id)
-        test_mark_as_read(storage, article_id)
-        test_statistics(storage)
-        test_search(storage)
-        test_user_preferences(storage)
-        test_recent_activity(storage)
-        test_delete_article(storage, article_id2)
-        
-        print("\n\n" + "=" * 60)
-        print("✅ ALL TESTS PASSED!")
-        print("=" * 60)
-        print("\nStorage module is working correctly.")
-        print("Database operations are functioning as expected.\n")
-        
-        # Clean up test database
-        cleanup_test_db()
-        print("Test database cleaned up.")
-    
-    except Exception as e:
-        print(f"\n\n❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
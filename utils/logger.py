@@ -1,11 +1,56 @@
 """
 Logging utility for Smart Read Later Organizer.
+
+Log with %-style arguments, not f-strings:
+
+    logger.debug("Extracted %s keywords", len(keywords))
+
+The message is then only formatted if a handler accepts the record; an
+f-string is built on every call, even when the level is filtered out.
 """
+import atexit
 import logging
-import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from config.config import Config
 
+# Create logs directory if it doesn't exist (once, at import)
+Path(Config.LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
+
+_LOG_LEVEL = getattr(logging, Config.LOG_LEVEL)
+
+# Formatters, built once and shared by the handlers below
+_CONSOLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_FILE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Console handler - for terminal output
+_CONSOLE_HANDLER = logging.StreamHandler()
+_CONSOLE_HANDLER.setLevel(logging.INFO)
+_CONSOLE_HANDLER.setFormatter(_CONSOLE_FORMATTER)
+
+# File handler - for detailed logs. Shared by every logger, so the log file
+# is opened once (on the first record) rather than once per module.
+_FILE_HANDLER = logging.FileHandler(Config.LOG_FILE, delay=True)
+_FILE_HANDLER.setLevel(logging.DEBUG)
+_FILE_HANDLER.setFormatter(_FILE_FORMATTER)
+
+# Loggers only enqueue records; one background thread formats and writes
+# them to the console and file, so logging call sites never block on I/O.
+# Stopped at exit, which writes out whatever is still queued.
+_LOG_QUEUE = queue.Queue()
+_QUEUE_HANDLER = QueueHandler(_LOG_QUEUE)
+_LISTENER = QueueListener(_LOG_QUEUE, _CONSOLE_HANDLER, _FILE_HANDLER,
+                          respect_handler_level=True)
+_LISTENER.start()
+atexit.register(_LISTENER.stop)
+
 
 def setup_logger(name: str) -> logging.Logger:
     """
@@ -17,36 +62,13 @@ def setup_logger(name: str) -> logging.Logger:
     Returns:
         logging.Logger: Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    log_dir = Path(Config.LOG_FILE).parent
-    log_dir.mkdir(parents=True, exist_ok=True)
-    
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, Config.LOG_LEVEL))
+    logger.setLevel(_LOG_LEVEL)
     
     # Prevent duplicate handlers
     if logger.handlers:
         return logger
     
-    # Console handler - for terminal output
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_format = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(console_format)
-    
-    # File handler - for detailed logs
-    file_handler = logging.FileHandler(Config.LOG_FILE)
-    file_handler.setLevel(logging.DEBUG)
-    file_format = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(file_format)
-    
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(_QUEUE_HANDLER)
     
     return logger
\ No newline at end of file
@@ -2,14 +2,43 @@
 Input validation utilities.
 """
 import re
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse
 
+# URL pattern - matches http(s) URLs up to whitespace, quotes, backticks,
+# backslashes or angle brackets. Parentheses and square brackets are kept
+# (e.g. Wikipedia links); an unbalanced closer at the end is trimmed by
+# _trim_closers. One greedy character class with nothing after it never
+# backtracks, so matching stays linear on arbitrary user text.
+_URL_RE = re.compile(r'https?://[^\s<>"\'`\\]+')
 
+# Longest URL extracted; longer ones are dropped rather than cut short
+MAX_URL_LENGTH = 2048
+
+# Closing characters trimmed from the end of a URL, and their openers
+_URL_CLOSERS = {')': '(', ']': '['}
+
+# Canonical hyphenated UUID, either case
+_UUID_RE = re.compile(
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
+    re.IGNORECASE
+)
+
+# Everything str.split() treats as whitespace in ASCII text, apart from a
+# single space
+_COLLAPSIBLE_WHITESPACE = ('  ', '\t', '\n', '\r', '\x0b', '\x0c',
+                           '\x1c', '\x1d', '\x1e', '\x1f')
+
+
+@lru_cache(maxsize=4096)
 def is_valid_url(url: str) -> bool:
     """
     Validate if a string is a valid URL.
     
+    Results are cached, so a URL repeated in a message (or across
+    messages) is parsed once.
+    
     Args:
         url: String to validate
         
@@ -23,10 +52,13 @@ def is_valid_url(url: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=1024)
 def sanitize_url(url: str) -> Optional[str]:
     """
     Clean and validate URL, adding scheme if missing.
     
+    Results are cached, since the same links tend to be pasted repeatedly.
+    
     Args:
         url: URL string to sanitize
         
@@ -42,6 +74,28 @@ def sanitize_url(url: str) -> Optional[str]:
     return url if is_valid_url(url) else None
 
 
+def _trim_closers(url: str) -> str:
+    """
+    Drop trailing ")" / "]" that have no matching opener in the URL.
+    
+    Matches GFM autolinking: "(see https://example.com/a)" yields
+    "https://example.com/a", while "https://en.wikipedia.org/wiki/Python_(programming_language)"
+    keeps its closing parenthesis.
+    
+    Args:
+        url: Matched URL
+        
+    Returns:
+        str: URL without unbalanced trailing closers
+    """
+    while url[-1] in _URL_CLOSERS:
+        closer = url[-1]
+        if url.count(closer) <= url.count(_URL_CLOSERS[closer]):
+            break
+        url = url[:-1]
+    return url
+
+
 def extract_urls_from_text(text: str) -> list[str]:
     """
     Extract all URLs from a text string.
@@ -50,12 +104,13 @@ def extract_urls_from_text(text: str) -> list[str]:
         text: Text to search for URLs
         
     Returns:
-        list[str]: List of valid URLs found
+        list[str]: List of valid URLs found, each once, in order of first appearance
     """
-    # URL pattern - matches http(s) URLs
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    urls = re.findall(url_pattern, text)
-    return [url for url in urls if is_valid_url(url)]
+    # A match can still lack a host (e.g. "https:///path"), so each distinct
+    # one is checked
+    urls = dict.fromkeys(_trim_closers(url) for url in _URL_RE.findall(text))
+    return [url for url in urls
+            if len(url) <= MAX_URL_LENGTH and is_valid_url(url)]
 
 
 def is_valid_uuid(uuid_string: str) -> bool:
@@ -68,8 +123,7 @@ def is_valid_uuid(uuid_string: str) -> bool:
     Returns:
         bool: True if valid UUID, False otherwise
     """
-    uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    return bool(re.match(uuid_pattern, uuid_string.lower()))
+    return _UUID_RE.fullmatch(uuid_string) is not None
 
 
 def sanitize_content(content: str, max_length: int = 50000) -> str:
@@ -83,12 +137,26 @@ def sanitize_content(content: str, max_length: int = 50000) -> str:
     Returns:
         str: Sanitized content
     """
-    # Remove excessive whitespace
-    content = re.sub(r'\s+', ' ', content)
-    content = content.strip()
+    # Already-normalized ASCII text only needs its ends trimmed; each check
+    # is a C-level substring scan, with no list of words built (isascii()
+    # is O(1), and non-ASCII text may hold Unicode whitespace to collapse)
+    if (len(content) <= max_length and content.isascii()
+            and not any(ws in content for ws in _COLLAPSIBLE_WHITESPACE)):
+        return content.strip()
+    
+    # For a long paste, collapse just a head slice when that already gives
+    # more than max_length characters (the collapsed head is a prefix of
+    # the collapsed whole, so the truncated result is the same)
+    if len(content) > 2 * max_length:
+        head = ' '.join(content[:2 * max_length].split())
+        if len(head) > max_length:
+            return f"{head[:max_length]}..."
+    
+    # Collapse whitespace runs and trim the ends (str.split() does both in C)
+    content = ' '.join(content.split())
     
     # Truncate if too long
     if len(content) > max_length:
-        content = content[:max_length] + "..."
+        content = f"{content[:max_length]}..."
     
     return content
\ No newline at end of file